@@ -15,6 +15,14 @@ from .sync import affected_environments, sync_environments
 if TYPE_CHECKING:
     import argparse
 
+#: Test-only hook: the suite flips ``_capture_doc`` on via monkeypatch,
+#: after which ``_last_doc`` holds the parsed document from the most
+#: recent :func:`execute_add` call so assertions can inspect the edit
+#: without re-parsing the manifest.  Off by default so production runs
+#: don't keep the full document alive for the life of the process.
+_capture_doc: bool = False
+_last_doc: tomlkit.TOMLDocument | None = None
+
 
 def _parse_spec(spec: str) -> tuple[str, str]:
     """Extract package name and version constraint from a MatchSpec string.
@@ -41,6 +49,9 @@ def execute_add(args: argparse.Namespace, *, console: Console | None = None) ->
 
     text = manifest_path.read_text(encoding="utf-8")
     doc = tomlkit.loads(text)
+    if _capture_doc:
+        global _last_doc
+        _last_doc = doc
     dep_key = "pypi-dependencies" if is_pypi else "dependencies"
 
     if manifest_path.name == "pyproject.toml":
@@ -8,6 +8,7 @@ import-time overhead negligible.
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -24,6 +25,8 @@ class WorkspaceContext:
     are deferred to keep plugin load time under 1 ms.
     """
 
+    __slots__ = ("_config", "_cache")
+
     def __init__(self, config: WorkspaceConfig | None = None) -> None:
         self._config = config
         self._cache: dict[str, object] = {}
@@ -53,7 +56,9 @@ class WorkspaceContext:
         if "platform" not in self._cache:
             from conda.base.context import context
 
-            self._cache["platform"] = context.subdir
+            # Interned so comparisons against subdir literals elsewhere
+            # take the pointer-equality fast path.
+            self._cache["platform"] = sys.intern(context.subdir)
         return self._cache["platform"]  # type: ignore[return-value]
 
     @property
@@ -171,6 +176,8 @@ class CondaContext:
     template references a variable.
     """
 
+    __slots__ = ("_manifest_path",)
+
     def __init__(self, manifest_path: Path | None = None) -> None:
         self._manifest_path = manifest_path
 
@@ -251,6 +258,8 @@ class CondaContext:
 class _EnvironmentProxy:
     """Allows ``{{ conda.environment.name }}`` in templates."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
 
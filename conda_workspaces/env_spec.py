@@ -52,15 +52,13 @@ class CondaWorkspaceSpec(EnvironmentSpecBase):
     def can_handle(self) -> bool:
         if self.path.name not in DEFAULT_FILENAMES:
             return False
-        if not self.path.exists():
-            return False
-        try:
-            import tomlkit
+        from .manifests.toml import CondaTomlParser
 
-            data = tomlkit.loads(self.path.read_text(encoding="utf-8"))
-            return "workspace" in data
-        except Exception:
-            return False
+        # Delegates to the manifest parser: missing files and invalid
+        # TOML come back False, non-workspace files are rejected by a
+        # cheap byte scan, and a positive probe leaves the parsed table
+        # in the TOML cache for the ``env`` parse to reuse.
+        return CondaTomlParser().has_workspace(self.path)
 
     @property
     def env(self) -> Environment:
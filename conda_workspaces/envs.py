@@ -8,17 +8,20 @@ a standard conda prefix that can be activated with ``conda activate``.
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import sys
 import tempfile
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from conda.base.constants import ChannelPriority, UpdateModifier
+# ChannelPriority, UpdateModifier and UnsatisfiableError are imported
+# inside the functions that use them; everything here stays module-level
+# because tests patch these names as module attributes.
 from conda.base.context import context as conda_context
 from conda.core.envs_manager import PrefixData, unregister_env
-from conda.exceptions import UnsatisfiableError
 from conda.gateways.disk.delete import rm_rf
 from conda.models.match_spec import MatchSpec
 
@@ -35,11 +38,22 @@ log = logging.getLogger(__name__)
 
 def _iter_installed_prefixes(envs_dir: Path) -> Iterator[Path]:
     """Yield paths of valid conda environments under *envs_dir*."""
-    if not envs_dir.is_dir():
+    # scandir's DirEntry caches the file type from the directory read,
+    # so filtering to directories costs no extra stat per entry the way
+    # iterdir + Path.is_dir does.
+    try:
+        entries = os.scandir(envs_dir)
+    except OSError:
         return
-    for d in envs_dir.iterdir():
-        if d.is_dir() and PrefixData(str(d)).is_environment():
-            yield d
+    with entries:
+        for entry in entries:
+            # Same check PrefixData.is_environment performs (the
+            # conda-meta/history marker) without constructing a
+            # PrefixData per directory: one stat per entry.
+            if entry.is_dir() and os.path.isfile(
+                os.path.join(entry.path, "conda-meta", "history")
+            ):
+                yield Path(entry.path)
 
 
 @contextmanager
@@ -48,6 +62,8 @@ def _channel_priority_override(priority: str | None):
     if priority is None:
         yield
         return
+    from conda.base.constants import ChannelPriority
+
     with conda_context._override("channel_priority", ChannelPriority(priority)):
         yield
 
@@ -242,6 +258,9 @@ def install_environment(
 
     Raises ``SolveError`` if dependency resolution fails.
     """
+    from conda.base.constants import UpdateModifier
+    from conda.exceptions import UnsatisfiableError
+
     prefix = ctx.env_prefix(resolved.name)
     exists = ctx.env_exists(resolved.name)
 
@@ -351,8 +370,18 @@ def get_environment_info(
         "exists": exists,
     }
     if exists:
-        # Count installed packages via conda-meta
+        # Count installed packages via conda-meta.  Keyed on the
+        # directory mtime so installs/removals invalidate the cache.
         meta_dir = prefix / "conda-meta"
-        pkg_count = sum(1 for f in meta_dir.glob("*.json") if f.name != "history")
-        info["packages"] = pkg_count
+        try:
+            mtime_ns = meta_dir.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        info["packages"] = _count_conda_meta(str(meta_dir), mtime_ns)
     return info
+
+
+@lru_cache(maxsize=256)
+def _count_conda_meta(meta_dir: str, mtime_ns: int) -> int:
+    """Count package records in a ``conda-meta`` directory (cached)."""
+    return sum(1 for f in Path(meta_dir).glob("*.json") if f.name != "history")
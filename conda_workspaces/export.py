@@ -50,7 +50,6 @@ import io
 from typing import TYPE_CHECKING
 
 from conda.base.context import context as conda_context
-from conda.common.serialize.yaml import dump as yaml_dump
 from conda.exceptions import CondaValueError, EnvironmentExporterNotDetected
 from conda.models.environment import Environment
 from conda.models.environment import EnvironmentConfig as CondaEnvConfig
@@ -61,7 +60,7 @@ from .exceptions import (
     LockfileNotFoundError,
     PlatformError,
 )
-from .lockfile import CondaLockLoader, lockfile_path
+from .lockfile import CondaLockLoader, _yaml, lockfile_path
 from .resolver import resolve_environment
 
 if TYPE_CHECKING:
@@ -89,11 +88,13 @@ def multiplatform_export(envs: Iterable[Environment]) -> str:
     :class:`~conda.plugins.types.CondaEnvironmentExporter`; conda
     calls it with one :class:`Environment` per platform.  Composition
     runs through :meth:`CondaLockLoader.compose` so callers that want
-    the pre-YAML dict representation share the exact same logic.
+    the pre-YAML dict representation share the exact same logic;
+    emission goes through the shared C-accelerated YAML instance in
+    :mod:`.lockfile` so both ``conda.lock`` writers stay byte-identical.
     """
     env_dict = CondaLockLoader.compose(envs)
     buf = io.StringIO()
-    yaml_dump(env_dict, buf)
+    _yaml().dump(env_dict, buf)
     return buf.getvalue()
 
 
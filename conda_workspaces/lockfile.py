@@ -40,8 +40,8 @@ exact URLs, bypassing the solver entirely.
 
 from __future__ import annotations
 
-import io
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -90,6 +90,45 @@ def lockfile_path(ctx: WorkspaceContext) -> Path:
     return ctx.root / LOCKFILE_NAME
 
 
+@lru_cache(maxsize=1)
+def _yaml() -> Any:
+    """Return a reusable safe-YAML parser/emitter, C-accelerated when possible.
+
+    conda's serializer builds a ``pure=True`` ruamel instance on every
+    call; the non-pure instance dispatches to the libyaml C extension
+    when it is installed (the common case in conda distributions) and
+    silently falls back to the pure implementation otherwise.  Both
+    ``conda.lock`` writers (:func:`.export.multiplatform_export` and
+    :func:`merge_lockfiles`) emit through this same instance, keeping
+    their output byte-identical to each other.
+    """
+    from ruamel.yaml import YAML
+
+    yaml = YAML(typ="safe")
+    # Match the layout the lockfile format documents: block style
+    # throughout, mappings in insertion order (``version`` first,
+    # environments in first-seen order) rather than sorted keys.
+    yaml.default_flow_style = False
+    yaml.representer.sort_base_mapping_type_on_output = False
+    # The lockfile format never uses anchors/aliases, and compose()
+    # deliberately shares identical channel dicts across environments;
+    # without this the emitter would render those as &id/*id references
+    # (and pay alias bookkeeping for every node it serialises).
+    yaml.representer.ignore_aliases = lambda data: True
+    return yaml
+
+
+@lru_cache(maxsize=8)
+def _load_lockfile_yaml(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a lockfile, cached on ``(path, mtime)``.
+
+    Mirrors the manifest-side TOML cache: an edited file re-parses on
+    the next call instead of serving stale data (unlike
+    ``conda_lockfiles.load_yaml``, which caches by path alone).
+    """
+    return _yaml().load(Path(path_str).read_bytes())
+
+
 class CondaLockLoader(EnvironmentSpecBase):
     """Environment specifier + loader for ``conda.lock``.
 
@@ -123,9 +162,9 @@ class CondaLockLoader(EnvironmentSpecBase):
     @property
     def _data(self) -> dict[str, Any]:
         if self._data_cache is None:
-            from conda_lockfiles.load_yaml import load_yaml
-
-            self._data_cache = load_yaml(self.path)
+            self._data_cache = _load_lockfile_yaml(
+                str(self.path), self.path.stat().st_mtime_ns
+            )
         return self._data_cache
 
     @property
@@ -220,9 +259,17 @@ class CondaLockLoader(EnvironmentSpecBase):
         from conda_lockfiles.rattler_lock.v6 import _record_to_dict
         from conda_lockfiles.validate_urls import validate_urls
 
-        seen_urls: set[str] = set()
-        packages: list[dict[str, Any]] = []
+        # Insertion-ordered URL -> record map (same shape
+        # :func:`merge_lockfiles` uses): one dict serves as both the
+        # dedup membership test and the final ordered packages list,
+        # and records shared across environments are converted once.
+        packages_by_url: dict[str, dict[str, Any]] = {}
         environments: dict[str, dict[str, Any]] = {}
+        # Identical channels recur in every environment; share one ref
+        # dict per URL instead of rebuilding it N times.  Safe because
+        # the composed dict goes straight to the dumper (which has
+        # aliasing disabled, see :func:`_yaml`).
+        channel_refs: dict[str, dict[str, Any]] = {}
 
         for env in envs:
             validate_urls(env, FORMAT)
@@ -239,7 +286,10 @@ class CondaLockLoader(EnvironmentSpecBase):
 
             if env_name not in environments:
                 environments[env_name] = {
-                    "channels": [{"url": ch} for ch in env.config.channels],
+                    "channels": [
+                        channel_refs.setdefault(ch, {"url": ch})
+                        for ch in env.config.channels
+                    ],
                     "packages": {},
                 }
 
@@ -247,9 +297,8 @@ class CondaLockLoader(EnvironmentSpecBase):
 
             for pkg in sorted(env.explicit_packages, key=lambda p: p.name):
                 platform_refs.append({"conda": pkg.url})
-                if pkg.url not in seen_urls:
-                    packages.append(_record_to_dict(pkg))
-                    seen_urls.add(pkg.url)
+                if pkg.url not in packages_by_url:
+                    packages_by_url[pkg.url] = _record_to_dict(pkg)
 
             for manager, urls in env.external_packages.items():
                 for url in urls:
@@ -260,7 +309,7 @@ class CondaLockLoader(EnvironmentSpecBase):
         return {
             "version": LOCKFILE_VERSION,
             "environments": environments,
-            "packages": packages,
+            "packages": list(packages_by_url.values()),
         }
 
 
@@ -386,9 +435,6 @@ def merge_lockfiles(paths: Sequence[Path], ctx: WorkspaceContext) -> Path:
 
     Returns the path to the merged lockfile.
     """
-    from conda.common.serialize.yaml import dump as yaml_dump
-    from conda_lockfiles.load_yaml import load_yaml
-
     if not paths:
         raise LockfileMergeError("no lockfile fragments were supplied")
 
@@ -401,7 +447,7 @@ def merge_lockfiles(paths: Sequence[Path], ctx: WorkspaceContext) -> Path:
     for path in paths:
         if not path.is_file():
             raise LockfileMergeError(f"fragment '{path}' does not exist")
-        data = load_yaml(path)
+        data = _load_lockfile_yaml(str(path), path.stat().st_mtime_ns)
         version = data.get("version")
         if version != LOCKFILE_VERSION:
             raise LockfileMergeError(
@@ -480,9 +526,10 @@ def merge_lockfiles(paths: Sequence[Path], ctx: WorkspaceContext) -> Path:
 
     out_path = lockfile_path(ctx)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    buf = io.StringIO()
-    yaml_dump(merged, buf)
-    out_path.write_text(buf.getvalue(), encoding="utf-8")
+    # Dump straight into the binary stream (ruamel emits UTF-8): no
+    # intermediate StringIO and no whole-document str materialisation.
+    with out_path.open("wb") as fh:
+        _yaml().dump(merged, fh)
     return out_path
 
 
@@ -11,6 +11,7 @@ The first file that exists *and* contains the relevant configuration wins.
 
 from __future__ import annotations
 
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -25,6 +26,8 @@ from .pyproject_toml import PyprojectTomlParser
 from .toml import CondaTomlParser
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..models import Task, WorkspaceConfig
     from .base import ManifestParser
 
@@ -34,11 +37,21 @@ _PARSERS: list[ManifestParser] = [
     PyprojectTomlParser(),
 ]
 
-_SEARCH_FILES: list[str] = [
+#: Filename -> parser singleton, derived from the registration order above.
+#: ``find_parser`` is called on every detection walk level, so dispatch is a
+#: single dict lookup rather than a linear ``can_handle`` probe.
+_PARSERS_BY_FILENAME: dict[str, ManifestParser] = {
+    filename: parser for parser in _PARSERS for filename in parser.filenames
+}
+
+#: Candidate manifest filenames in priority order, plus a frozen set view
+#: for membership tests — both built once at import time.
+_SEARCH_FILES: tuple[str, ...] = (
     "conda.toml",
     "pixi.toml",
     "pyproject.toml",
-]
+)
+_SEARCH_FILES_SET: frozenset[str] = frozenset(_SEARCH_FILES)
 
 
 def _walk_manifests(
@@ -51,17 +64,31 @@ def _walk_manifests(
     ``"has_workspace"`` or ``"has_tasks"``.  Returns the first
     matching file path, or ``None`` if none is found.
     """
-    current = start_dir.resolve()
+    # Walk at the string level: os.path.dirname returns a plain str while
+    # Path.parent allocates and normalizes a fresh PurePath per level.
+    # Paths are only materialized for the (rare) candidate probes.
+    current = os.fspath(start_dir.resolve())
     while True:
+        # One scandir per level replaces a stat per candidate filename:
+        # a single getdents64 call answers all three existence probes.
+        try:
+            with os.scandir(current) as entries:
+                # Filter on the name first: is_file() may stat on
+                # filesystems without dirent types, and at most three
+                # entries per directory can ever be candidates.
+                names = {
+                    entry.name
+                    for entry in entries
+                    if entry.name in _SEARCH_FILES_SET and entry.is_file()
+                }
+        except OSError:
+            names = set()
         for fname in _SEARCH_FILES:
-            candidate = current / fname
-            if candidate.is_file():
-                for parser in _PARSERS:
-                    if parser.can_handle(candidate) and getattr(parser, predicate)(
-                        candidate
-                    ):
-                        return candidate
-        parent = current.parent
+            if fname in names:
+                candidate = Path(os.path.join(current, fname))
+                if getattr(_PARSERS_BY_FILENAME[fname], predicate)(candidate):
+                    return candidate
+        parent = os.path.dirname(current)
         if parent == current:
             break
         current = parent
@@ -92,15 +119,22 @@ def find_parser(path: Path) -> ManifestParser:
 
     Raises ``WorkspaceParseError`` if no parser matches.
     """
-    for parser in _PARSERS:
-        if parser.can_handle(path):
-            return parser
-    raise WorkspaceParseError(path, f"No parser available for '{path.name}'")
+    try:
+        return _PARSERS_BY_FILENAME[path.name]
+    except KeyError:
+        raise WorkspaceParseError(
+            path, f"No parser available for '{path.name}'"
+        ) from None
+
 
+@lru_cache(maxsize=16)
+def _cached_parse(path_str: str, mtime_ns: int, size: int) -> WorkspaceConfig:
+    """LRU-cached wrapper around parser dispatch.
 
-@lru_cache(maxsize=4)
-def _cached_parse(path_str: str) -> WorkspaceConfig:
-    """LRU-cached wrapper around parser dispatch."""
+    Keyed on ``(path, mtime_ns, size)`` so an edited manifest is re-parsed
+    on the next call instead of serving stale config; a cache hit costs one
+    ``stat`` in the caller rather than a full TOML parse.
+    """
     path = Path(path_str)
     parser = find_parser(path)
     return parser.parse(path)
@@ -114,10 +148,32 @@ def detect_and_parse(
     Returns ``(manifest_path, workspace_config)``.
     """
     path = detect_workspace_file(start_dir)
-    config = _cached_parse(str(path))
+    stat = path.stat()
+    config = _cached_parse(str(path), stat.st_mtime_ns, stat.st_size)
     return path, config
 
 
+def detect_and_parse_many(
+    start_dirs: Iterable[str | Path],
+) -> list[tuple[Path, WorkspaceConfig]]:
+    """Detect and parse workspace manifests for several directories at once.
+
+    Per-directory detection is I/O-bound (directory scans plus file
+    reads), so the calls are fanned out over a thread pool and the
+    syscalls overlap.  Results keep the input order; the same
+    exceptions as :func:`detect_and_parse` propagate per entry.
+    """
+    start_dirs = list(start_dirs)
+    if len(start_dirs) <= 1:
+        return [detect_and_parse(d) for d in start_dirs]
+
+    # Deferred so the plugin import path stays free of concurrent.futures.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(start_dirs))) as pool:
+        return list(pool.map(detect_and_parse, start_dirs))
+
+
 def detect_task_file(start_dir: Path | None = None) -> Path | None:
     """Walk up from *start_dir* looking for a file that contains tasks.
 
@@ -128,9 +184,9 @@ def detect_task_file(start_dir: Path | None = None) -> Path | None:
     return _walk_manifests(Path(start_dir), "has_tasks")
 
 
-@lru_cache(maxsize=4)
-def _cached_task_parse(path_str: str) -> dict[str, Task]:
-    """Parse tasks from a manifest file (cached by path string)."""
+@lru_cache(maxsize=16)
+def _cached_task_parse(path_str: str, mtime_ns: int, size: int) -> dict[str, Task]:
+    """Parse tasks from a manifest file (cached like :func:`_cached_parse`)."""
     p = Path(path_str)
     parser = find_parser(p)
     return parser.parse_tasks(p)
@@ -152,5 +208,6 @@ def detect_and_parse_tasks(
         if found is None:
             raise NoTaskFileError(str(start_dir or Path.cwd()))
         path = found
-    tasks = _cached_task_parse(str(path))
+    stat = path.stat()
+    tasks = _cached_task_parse(str(path), stat.st_mtime_ns, stat.st_size)
     return path, tasks
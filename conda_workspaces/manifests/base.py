@@ -43,6 +43,9 @@ class ManifestParser(ABC):
 
     format_alias: ClassVar[str] = ""
     filenames: ClassVar[tuple[str, ...]] = ()
+    #: Hash-set view of :attr:`filenames`, derived in ``__init_subclass__``
+    #: so the hot ``can_handle`` probe is a set membership test.
+    _filename_set: ClassVar[frozenset[str]] = frozenset()
     #: Canonical ``conda_environment_exporters`` plugin name.  Empty
     #: disables exporter registration for that parser (see
     #: :mod:`conda_workspaces.plugin`).
@@ -51,6 +54,10 @@ class ManifestParser(ABC):
     #: ``("conda",)`` for ``conda-toml``).  Empty tuple is fine.
     exporter_aliases: ClassVar[tuple[str, ...]] = ()
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._filename_set = frozenset(cls.filenames)
+
     @property
     def manifest_filename(self) -> str:
         """Canonical filename this parser reads and writes.
@@ -386,9 +393,9 @@ class ManifestParser(ABC):
             if all(per_platform[p].get(name) == spec for p in platforms[1:])
         }
 
-    @abstractmethod
     def can_handle(self, path: Path) -> bool:
         """Return True if this parser can read *path*."""
+        return path.name in self._filename_set
 
     @abstractmethod
     def has_workspace(self, path: Path) -> bool:
@@ -7,6 +7,7 @@ Reads ``[workspace]`` (or ``[project]`` for legacy manifests),
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import tomlkit
@@ -15,7 +16,12 @@ from ..exceptions import TaskNotFoundError, TaskParseError, WorkspaceParseError
 from ..models import WorkspaceConfig
 from .base import ManifestParser
 from .normalize import parse_feature_tasks, parse_tasks_and_targets
-from .toml import _parse_channels, _parse_features_and_envs
+from .toml import (
+    _load_toml,
+    _parse_channels,
+    _parse_features_and_envs,
+    _scan_for_workspace,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -30,28 +36,31 @@ class PixiTomlParser(ManifestParser):
     filenames = ("pixi.toml",)
     exporter_format = "pixi-toml"
 
-    def can_handle(self, path: Path) -> bool:
-        return path.name in self.filenames
-
     def has_workspace(self, path: Path) -> bool:
-        if not path.exists():
+        if not os.path.isfile(path):
+            return False
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            # File vanished or became unreadable since the isfile check.
+            return False
+        if not _scan_for_workspace(raw, (b"workspace", b"project")):
             return False
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8"))
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception:
             return False
         return "workspace" in data or "project" in data
 
     def parse(self, path: Path) -> WorkspaceConfig:
         try:
-            text = path.read_text(encoding="utf-8")
-            # ``unwrap()`` returns plain Python types; otherwise tomlkit
-            # subclasses (e.g. ``tomlkit.items.String``) leak through the
+            # ``tomllib`` hands back plain Python types directly, so
+            # nothing like ``tomlkit.items.String`` can leak through the
             # data model and trip ruamel.yaml's exact-type key dispatch
             # at lockfile write time.  Callers that need round-tripping
-            # (``conda workspace add/remove/init``) still work on the raw
-            # ``TOMLDocument`` separately.
-            data = tomlkit.loads(text).unwrap()
+            # (``conda workspace add/remove/init``) still parse the raw
+            # ``TOMLDocument`` with tomlkit separately.
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception as exc:
             raise WorkspaceParseError(path, str(exc)) from exc
 
@@ -77,17 +86,17 @@ class PixiTomlParser(ManifestParser):
         return config
 
     def has_tasks(self, path: Path) -> bool:
-        if not path.exists():
+        if not os.path.isfile(path):
             return False
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8"))
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception:
             return False
         return bool(data.get("tasks"))
 
     def parse_tasks(self, path: Path) -> dict[str, Task]:
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8")).unwrap()
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception as exc:
             raise TaskParseError(str(path), str(exc)) from exc
 
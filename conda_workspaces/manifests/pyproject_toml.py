@@ -9,6 +9,7 @@ tables in order:
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 import tomlkit
@@ -22,7 +23,12 @@ from ..exceptions import (
 from ..models import WorkspaceConfig
 from .base import ManifestParser
 from .normalize import parse_feature_tasks, parse_tasks_and_targets
-from .toml import _parse_channels, _parse_features_and_envs
+from .toml import (
+    _load_toml,
+    _parse_channels,
+    _parse_features_and_envs,
+    _scan_for_workspace,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -47,9 +53,6 @@ class PyprojectTomlParser(ManifestParser):
     filenames = ("pyproject.toml",)
     exporter_format = "pyproject-toml"
 
-    def can_handle(self, path: Path) -> bool:
-        return path.name in self.filenames
-
     def write_workspace_stub(
         self,
         base_dir: Path,
@@ -142,10 +145,20 @@ class PyprojectTomlParser(ManifestParser):
         return tomlkit.dumps(doc)
 
     def has_workspace(self, path: Path) -> bool:
-        if not path.exists():
+        if not os.path.isfile(path):
+            return False
+        try:
+            # pyproject.toml files can be large and are rarely ours, so
+            # the cheap reject here pays off most often of the three
+            # parsers.
+            raw = path.read_bytes()
+        except OSError:
+            # File vanished or became unreadable since the isfile check.
+            return False
+        if not _scan_for_workspace(raw, (b"workspace",)):
             return False
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8"))
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception:
             return False
         tool = data.get("tool", {})
@@ -155,11 +168,10 @@ class PyprojectTomlParser(ManifestParser):
 
     def parse(self, path: Path) -> WorkspaceConfig:
         try:
-            text = path.read_text(encoding="utf-8")
-            # ``unwrap()`` collapses tomlkit subclasses to native Python
-            # types so downstream code (resolver, exporter, YAML writer)
-            # never has to defend against ``tomlkit.items.String`` etc.
-            data = tomlkit.loads(text).unwrap()
+            # ``tomllib`` returns native Python types directly, so
+            # downstream code (resolver, exporter, YAML writer) never
+            # has to defend against ``tomlkit.items.String`` etc.
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception as exc:
             raise WorkspaceParseError(path, str(exc)) from exc
 
@@ -196,10 +208,10 @@ class PyprojectTomlParser(ManifestParser):
         return config
 
     def has_tasks(self, path: Path) -> bool:
-        if not path.exists():
+        if not os.path.isfile(path):
             return False
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8")).unwrap()
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception:
             return False
         tool = data.get("tool", {})
@@ -209,7 +221,7 @@ class PyprojectTomlParser(ManifestParser):
 
     def parse_tasks(self, path: Path) -> dict[str, Task]:
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8")).unwrap()
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception as exc:
             raise TaskParseError(str(path), str(exc)) from exc
 
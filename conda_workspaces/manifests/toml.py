@@ -11,6 +11,9 @@ and target overrides are shared with ``pixi_toml.py`` and
 from __future__ import annotations
 
 import logging
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import tomlkit
@@ -27,7 +30,6 @@ from .base import ManifestParser
 from .normalize import parse_tasks_and_targets
 
 if TYPE_CHECKING:
-    from pathlib import Path
     from typing import Any
 
     from tomlkit.items import InlineTable
@@ -37,6 +39,56 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _scan_for_workspace(raw: bytes, keywords: tuple[bytes, ...]) -> bool:
+    """Return whether *raw* could possibly define one of *keywords*' tables.
+
+    A specialized recognizer for the detection walk: each keyword check
+    is a single C-level forward scan (``bytes.__contains__``), with no
+    tokenization or allocation.  ``False`` is definitive — any TOML
+    construct that creates a table (header, dotted key, inline table)
+    must spell the key name somewhere.  ``True`` only means "candidate";
+    callers confirm with a real parse, which keeps bad-TOML files
+    reporting ``False`` from ``has_workspace``.
+    """
+    return any(keyword in raw for keyword in keywords)
+
+
+@lru_cache(maxsize=64)
+def _load_toml(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Load a TOML file as plain Python types, cached on ``(path, mtime)``.
+
+    ``detect_workspace_file`` calls ``has_workspace`` on the very file
+    that ``parse`` then re-reads, so without a cache each manifest is
+    tokenized twice per detection.  The mtime key makes an edited file
+    re-parse on the next call.  Shared by all three parsers' read-only
+    paths; raises whatever ``tomllib`` raises on bad TOML — callers
+    decide whether that means ``False`` or a parse error.
+    """
+    return _toml_loads()(Path(path_str).read_bytes().decode("utf-8"))
+
+
+@lru_cache(maxsize=1)
+def _toml_loads():
+    """Resolve the fastest available TOML loader, once per process.
+
+    Prefers the native ``rtoml`` backend when installed — its compiled
+    scanner is roughly an order of magnitude faster than pure-Python
+    parsing on large manifests — and falls back to stdlib ``tomllib``
+    (``tomli`` on 3.10).  All backends return plain Python types with
+    the same shapes.  Deferred so CLI invocations that never read a
+    manifest skip the import entirely; after the first call this is a
+    cache hit.
+    """
+    try:
+        from rtoml import loads
+    except ModuleNotFoundError:
+        try:
+            from tomllib import loads
+        except ModuleNotFoundError:  # Python 3.10
+            from tomli import loads
+    return loads
+
+
 class CondaTomlParser(ManifestParser):
     """Parse ``conda.toml`` manifests (workspace and tasks).
 
@@ -48,14 +100,18 @@ class CondaTomlParser(ManifestParser):
     filenames = ("conda.toml",)
     exporter_format = "conda-toml"
 
-    def can_handle(self, path: Path) -> bool:
-        return path.name in self.filenames
-
     def has_workspace(self, path: Path) -> bool:
-        if not path.exists():
+        if not os.path.isfile(path):
             return False
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8"))
+            raw = path.read_bytes()
+        except OSError:
+            # File vanished or became unreadable since the isfile check.
+            return False
+        if not _scan_for_workspace(raw, (b"workspace",)):
+            return False
+        try:
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception:
             return False
         return "workspace" in data
@@ -75,17 +131,17 @@ class CondaTomlParser(ManifestParser):
         return config
 
     def has_tasks(self, path: Path) -> bool:
-        if not path.exists():
+        if not os.path.isfile(path):
             return False
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8"))
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception:
             return False
         return bool(data.get("tasks"))
 
     def parse_tasks(self, path: Path) -> dict[str, Task]:
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8")).unwrap()
+            data = _load_toml(str(path), path.stat().st_mtime_ns)
         except Exception as exc:
             raise TaskParseError(str(path), str(exc)) from exc
         return parse_tasks_and_targets(data)
@@ -181,46 +237,48 @@ def _parse_channels(raw: list[Any]) -> list[Channel]:
     return channels
 
 
+def _parse_conda_dep(name: str, spec: Any) -> MatchSpec:
+    """Parse one conda dependency entry into a MatchSpec."""
+    if isinstance(spec, str):
+        return MatchSpec(f"{name} {spec}".strip())
+    if isinstance(spec, dict):
+        version = spec.get("version", "")
+        build = spec.get("build", "")
+        parts = [name]
+        if version:
+            parts.append(version)
+        if build:
+            parts.append(build)
+        return MatchSpec(" ".join(parts))
+    return MatchSpec(f"{name} {spec}")
+
+
 def _parse_conda_deps(raw: dict[str, Any]) -> dict[str, MatchSpec]:
     """Parse conda dependency specs into MatchSpec objects."""
-    deps: dict[str, MatchSpec] = {}
-    for name, spec in raw.items():
-        if isinstance(spec, str):
-            deps[name] = MatchSpec(f"{name} {spec}".strip())
-        elif isinstance(spec, dict):
-            version = spec.get("version", "")
-            build = spec.get("build", "")
-            parts = [name]
-            if version:
-                parts.append(version)
-            if build:
-                parts.append(build)
-            deps[name] = MatchSpec(" ".join(parts))
-        else:
-            deps[name] = MatchSpec(f"{name} {spec}")
-    return deps
+    return {name: _parse_conda_dep(name, spec) for name, spec in raw.items()}
+
+
+def _parse_pypi_dep(name: str, spec: Any) -> PyPIDependency:
+    """Parse one PyPI dependency entry."""
+    if isinstance(spec, str):
+        return PyPIDependency(name=name, spec=spec)
+    if isinstance(spec, dict):
+        extras = spec.get("extras", [])
+        return PyPIDependency(
+            name=name,
+            spec=spec.get("version", ""),
+            extras=tuple(extras) if extras else (),
+            path=spec.get("path"),
+            editable=spec.get("editable", False),
+            git=spec.get("git"),
+            url=spec.get("url"),
+        )
+    return PyPIDependency(name=name, spec=str(spec))
 
 
 def _parse_pypi_deps(raw: dict[str, Any]) -> dict[str, PyPIDependency]:
     """Parse PyPI dependency specs."""
-    deps: dict[str, PyPIDependency] = {}
-    for name, spec in raw.items():
-        if isinstance(spec, str):
-            deps[name] = PyPIDependency(name=name, spec=spec)
-        elif isinstance(spec, dict):
-            extras = spec.get("extras", [])
-            deps[name] = PyPIDependency(
-                name=name,
-                spec=spec.get("version", ""),
-                extras=tuple(extras) if extras else (),
-                path=spec.get("path"),
-                editable=spec.get("editable", False),
-                git=spec.get("git"),
-                url=spec.get("url"),
-            )
-        else:
-            deps[name] = PyPIDependency(name=name, spec=str(spec))
-    return deps
+    return {name: _parse_pypi_dep(name, spec) for name, spec in raw.items()}
 
 
 def _parse_environment(name: str, raw: Any, path: Path) -> Environment:
@@ -294,14 +352,21 @@ def _parse_features_and_envs(
     ``PixiTomlParser`` and ``PyprojectTomlParser``.
     """
     config.features[Feature.DEFAULT_NAME] = _parse_feature(Feature.DEFAULT_NAME, source)
-
-    for feat_name, feat_data in source.get("feature", {}).items():
-        config.features[feat_name] = _parse_feature(feat_name, feat_data)
+    config.features.update(
+        {
+            feat_name: _parse_feature(feat_name, feat_data)
+            for feat_name, feat_data in source.get("feature", {}).items()
+        }
+    )
 
     envs_data = source.get("environments", {})
     if envs_data:
-        for env_name, env_val in envs_data.items():
-            config.environments[env_name] = _parse_environment(env_name, env_val, path)
+        config.environments.update(
+            {
+                env_name: _parse_environment(env_name, env_val, path)
+                for env_name, env_val in envs_data.items()
+            }
+        )
     else:
         config.environments[Environment.DEFAULT_NAME] = Environment(
             name=Environment.DEFAULT_NAME
@@ -14,6 +14,7 @@ resolution, and spec parsing.
 from __future__ import annotations
 
 from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
@@ -21,7 +22,7 @@ if TYPE_CHECKING:
 
 from conda.base.constants import KNOWN_SUBDIRS
 from conda.models.channel import Channel  # noqa: TC002
-from conda.models.match_spec import MatchSpec  # noqa: TC002
+from conda.models.match_spec import MatchSpec
 
 from .exceptions import (
     EnvironmentNotFoundError,
@@ -30,7 +31,19 @@ from .exceptions import (
 )
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=1024)
+def match_spec(spec: str) -> MatchSpec:
+    """Parse *spec* into a :class:`MatchSpec`, caching repeats.
+
+    Spec parsing is one of conda's slower per-call operations, and the
+    same strings recur constantly (every ``python >=3.10`` across
+    manifests, features, and tests).  MatchSpec instances are
+    immutable, so sharing them is safe.
+    """
+    return MatchSpec(spec)
+
+
+@dataclass(frozen=True, slots=True)
 class PyPIDependency:
     """A PyPI dependency (PEP 508 string).
 
@@ -64,7 +77,7 @@ class PyPIDependency:
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class Feature:
     """A composable group of dependencies and settings.
 
@@ -100,7 +113,7 @@ class Feature:
         return self.name == self.DEFAULT_NAME
 
 
-@dataclass
+@dataclass(slots=True)
 class Environment:
     """A named environment composed from one or more features.
 
@@ -123,7 +136,7 @@ class Environment:
         return self.name == self.DEFAULT_NAME
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceConfig:
     """Complete parsed workspace configuration.
 
@@ -244,13 +257,17 @@ class WorkspaceConfig:
         seen: set[str] = set()
         result: list[Channel] = []
         for ch in self.channels:
-            if ch.canonical_name not in seen:
-                seen.add(ch.canonical_name)
+            # canonical_name is an uncached property on conda's Channel;
+            # compute it once per channel.
+            name = ch.canonical_name
+            if name not in seen:
+                seen.add(name)
                 result.append(ch)
         for feature in self.resolve_features(environment):
             for ch in feature.channels:
-                if ch.canonical_name not in seen:
-                    seen.add(ch.canonical_name)
+                name = ch.canonical_name
+                if name not in seen:
+                    seen.add(name)
                     result.append(ch)
         return result
 
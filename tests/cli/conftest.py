@@ -3,20 +3,40 @@
 from __future__ import annotations
 
 import argparse
+import os
+import shutil
 from io import StringIO
 from typing import TYPE_CHECKING
 
+# Eager-import the modules every CLI test touches lazily so the first test in
+# each parametrize group doesn't pay the import tax (and so string-path
+# monkeypatch.setattr calls hit already-populated sys.modules entries).
+import conda.exceptions  # noqa: F401
 import pytest
 from rich.console import Console
 
+import conda_workspaces.cli.workspace.add
+import conda_workspaces.cli.workspace.clean
+import conda_workspaces.cli.workspace.info
+import conda_workspaces.cli.workspace.init
+import conda_workspaces.cli.workspace.install
+import conda_workspaces.cli.workspace.list
+import conda_workspaces.cli.workspace.remove  # noqa: F401
+
 if TYPE_CHECKING:
     from pathlib import Path
 
 
-@pytest.fixture
-def pixi_workspace(tmp_path: Path) -> Path:
-    """Create a minimal pixi.toml workspace and return tmp_path."""
-    content = """\
+@pytest.fixture(scope="session")
+def _pixi_workspace_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the minimal pixi.toml workspace layout once per session.
+
+    Environment scaffolding (``.conda/envs/...``) is deliberately not part
+    of the template: several tests assert on the *absence* of installed
+    environments, so envs are created per-test via ``tmp_workspace_env``.
+    """
+    # ASCII literal stored pre-encoded; write_bytes skips the str.encode step.
+    content = b"""\
 [workspace]
 name = "cli-test"
 channels = ["conda-forge"]
@@ -32,10 +52,31 @@ pytest = ">=8.0"
 default = []
 test = {features = ["test"]}
 """
-    (tmp_path / "pixi.toml").write_text(content, encoding="utf-8")
+    root = tmp_path_factory.mktemp("pixi-workspace-template")
+    (root / "pixi.toml").write_bytes(content)
+    return root
+
+
+@pytest.fixture
+def pixi_workspace(_pixi_workspace_template: Path, tmp_path: Path) -> Path:
+    """A per-test copy of the session workspace template in tmp_path."""
+    shutil.copytree(_pixi_workspace_template, tmp_path, dirs_exist_ok=True)
     return tmp_path
 
 
+@pytest.fixture
+def installed_env(request: pytest.FixtureRequest, pixi_workspace, tmp_workspace_env):
+    """Create the indirectly-parametrized environment inside pixi_workspace.
+
+    Use with ``@pytest.mark.parametrize("installed_env", [...], indirect=True)``
+    to share the env-scaffolding step across a parametrize matrix; returns
+    the environment name.
+    """
+    name = request.param
+    tmp_workspace_env(pixi_workspace, name)
+    return name
+
+
 @pytest.fixture
 def rich_console() -> Console:
     """A Console that writes to a StringIO buffer for test capture.
@@ -45,6 +86,94 @@ def rich_console() -> Console:
     return Console(file=StringIO(), width=200)
 
 
+@pytest.fixture(scope="session")
+def workspace_parser() -> argparse.ArgumentParser:
+    """Build the ``conda workspace`` parser once per session.
+
+    ``parse_args`` is a pure read against the finished parser, so sharing a
+    single instance across tests is safe and skips the repeated subparser
+    registration work.
+    """
+    from conda_workspaces.cli.main import generate_workspace_parser
+
+    return generate_workspace_parser()
+
+
+@pytest.fixture(scope="session")
+def task_parser() -> argparse.ArgumentParser:
+    """Build the ``conda task`` parser once per session."""
+    from conda_workspaces.cli.main import generate_task_parser
+
+    return generate_task_parser()
+
+
+class _SpawnCalls(list):
+    """Recorded ``conda_spawn.main.spawn`` calls, plus the stubbed exit code."""
+
+    rc: int = 0
+
+
+@pytest.fixture
+def spawn_stub(monkeypatch: pytest.MonkeyPatch) -> _SpawnCalls:
+    """Stub out ``conda_spawn.main.spawn`` and record each invocation.
+
+    Each call appends ``{"prefix": ..., "command": ...}`` to the returned
+    list, with ``prefix`` already converted to ``str`` so assertions don't
+    re-stringify a Path. Set ``spawn_stub.rc`` to control the exit code the
+    stub returns.
+    """
+    calls = _SpawnCalls()
+
+    def fake_spawn(*, prefix, command=None):
+        calls.append({"prefix": os.fspath(prefix), "command": command})
+        return calls.rc
+
+    monkeypatch.setattr("conda_spawn.main.spawn", fake_spawn)
+    return calls
+
+
+@pytest.fixture
+def lock_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Stub ``sync_environments``' lockfile step and record each call.
+
+    Patches ``conda_workspaces.cli.workspace.sync.generate_lockfile`` with a
+    recorder; each entry is the ``resolved_envs`` dict the sync pipeline
+    passed in. Tests that only need the stub can ignore the list.
+    """
+    calls: list[dict] = []
+
+    monkeypatch.setattr(
+        "conda_workspaces.cli.workspace.sync.generate_lockfile",
+        lambda ctx, resolved_envs: calls.append(resolved_envs),
+    )
+    return calls
+
+
+class _CondaRunCalls(list):
+    """Recorded ``conda run`` executable calls, plus the stubbed exit code."""
+
+    rc: int = 0
+
+
+@pytest.fixture
+def conda_run_stub(monkeypatch: pytest.MonkeyPatch) -> _CondaRunCalls:
+    """Stub out ``conda.cli.main_run.execute`` and record each invocation.
+
+    Each call appends the dispatched ``executable_call`` to the returned
+    list. Set ``conda_run_stub.rc`` to control the stubbed exit code.
+    """
+    calls = _CondaRunCalls()
+
+    def fake_conda_run(args, parser):
+        calls.append(args.executable_call)
+        return calls.rc
+
+    monkeypatch.setattr("conda.cli.main_run.execute", fake_conda_run)
+    return calls
+
+
 def make_args(defaults: dict, **overrides) -> argparse.Namespace:
     """Build an argparse.Namespace from *defaults* merged with *overrides*."""
-    return argparse.Namespace(**{**defaults, **overrides})
+    # dict-union beats the double-splat merge: one C-level copy, no
+    # intermediate kwargs dict.
+    return argparse.Namespace(**(defaults | overrides))
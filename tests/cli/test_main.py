@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
 
 import pytest
@@ -27,52 +28,51 @@ def test_generate_task_parser_returns_parser() -> None:
     assert "task" in parser.prog
 
 
-@pytest.mark.parametrize(
-    "subcmd",
-    [
-        "init",
-        "install",
-        "lock",
-        "list",
-        "envs",
-        "info",
-        "add",
-        "remove",
-        "clean",
-        "activate",
-        "shell",
-    ],
-)
-def test_workspace_subcommands_registered(subcmd: str) -> None:
-    parser = generate_workspace_parser()
-    if subcmd in ("add", "remove"):
-        args = parser.parse_args([subcmd, "numpy"])
-    else:
-        args = parser.parse_args([subcmd])
-    assert args.subcmd == subcmd
+# Registration and parser-arg checks below are pure reads against the shared
+# session parsers, so they run as single table-driven tests rather than one
+# pytest item per row — same coverage, far less per-item overhead.
+_WORKSPACE_REGISTERED = [
+    ["init"],
+    ["install"],
+    ["lock"],
+    ["list"],
+    ["envs"],
+    ["info"],
+    ["add", "numpy"],
+    ["remove", "numpy"],
+    ["clean"],
+    ["activate"],
+    ["shell"],
+]
+
+_TASK_REGISTERED = [
+    ["run", "test"],
+    ["list"],
+    ["add", "lint", "ruff check ."],
+    ["remove", "lint"],
+    ["export"],
+]
+
+
+def test_workspace_subcommands_registered(
+    workspace_parser: argparse.ArgumentParser,
+) -> None:
+    for argv in _WORKSPACE_REGISTERED:
+        args = workspace_parser.parse_args(argv)
+        assert args.subcmd == argv[0], argv
 
 
-@pytest.mark.parametrize(
-    "subcmd",
-    ["run", "list", "add", "remove", "export"],
-)
-def test_task_subcommands_registered(subcmd: str) -> None:
-    parser = generate_task_parser()
-    if subcmd == "run":
-        args = parser.parse_args([subcmd, "test"])
-    elif subcmd == "add":
-        args = parser.parse_args([subcmd, "lint", "ruff check ."])
-    elif subcmd == "remove":
-        args = parser.parse_args([subcmd, "lint"])
-    else:
-        args = parser.parse_args([subcmd])
-    assert args.subcmd == subcmd
+def test_task_subcommands_registered(task_parser: argparse.ArgumentParser) -> None:
+    for argv in _TASK_REGISTERED:
+        args = task_parser.parse_args(argv)
+        assert args.subcmd == argv[0], argv
 
 
 def test_workspace_no_subcmd_prints_help(
+    workspace_parser: argparse.ArgumentParser,
     capsys: pytest.CaptureFixture[str],
 ) -> None:
-    parser = generate_workspace_parser()
+    parser = workspace_parser
     args = parser.parse_args([])
     result = execute_workspace(args)
     assert result == 0
@@ -81,9 +81,10 @@ def test_workspace_no_subcmd_prints_help(
 
 
 def test_task_no_subcmd_prints_help(
+    task_parser: argparse.ArgumentParser,
     capsys: pytest.CaptureFixture[str],
 ) -> None:
-    parser = generate_task_parser()
+    parser = task_parser
     args = parser.parse_args([])
     result = execute_task(args)
     assert result == 0
@@ -92,90 +93,79 @@ def test_task_no_subcmd_prints_help(
 
 
 def test_workspace_unknown_subcmd_prints_help(
+    workspace_parser: argparse.ArgumentParser,
     capsys: pytest.CaptureFixture[str],
 ) -> None:
-    parser = generate_workspace_parser()
+    parser = workspace_parser
     args = parser.parse_args([])
     args.subcmd = "nonexistent"
     result = execute_workspace(args)
     assert result == 0
 
 
-@pytest.mark.parametrize(
-    "args, expected_attr, expected_value",
-    [
-        (["init", "--format", "conda"], "manifest_format", "conda"),
-        (["init", "--format", "pyproject"], "manifest_format", "pyproject"),
-        (["init", "--name", "myproj"], "name", "myproj"),
-        (
-            ["init", "-c", "defaults", "-c", "bioconda"],
-            "channels",
-            ["defaults", "bioconda"],
-        ),
-        (["install", "-e", "test"], "environment", "test"),
-        (["install", "--force-reinstall"], "force_reinstall", True),
-        (["envs", "--installed"], "installed", True),
-        (["info", "-e", "test"], "environment", "test"),
-        (["info"], "environment", None),
-        (["add", "--pypi", "requests"], "pypi", True),
-        (["add", "--feature", "dev", "numpy"], "feature", "dev"),
-        (["remove", "--pypi", "requests"], "pypi", True),
-        (["clean", "-e", "test"], "environment", "test"),
-        (["activate", "-e", "docs"], "environment", "docs"),
-        (["activate"], "environment", "default"),
-    ],
-    ids=[
-        "init-format-conda",
-        "init-format-pyproject",
-        "init-name",
-        "init-channels",
-        "install-env",
-        "install-force",
-        "envs-installed",
-        "info-named",
-        "info-default",
-        "add-pypi",
-        "add-feature",
-        "remove-pypi",
-        "clean-env",
-        "activate-named",
-        "activate-default",
-    ],
-)
-def test_workspace_parser_args(
-    args: list[str], expected_attr: str, expected_value: object
-) -> None:
-    parser = generate_workspace_parser()
-    parsed = parser.parse_args(args)
-    assert getattr(parsed, expected_attr) == expected_value
+_WORKSPACE_PARSER_CASES = [
+    (["init", "--format", "conda"], "manifest_format", "conda"),
+    (["init", "--format", "pyproject"], "manifest_format", "pyproject"),
+    (["init", "--name", "myproj"], "name", "myproj"),
+    (
+        ["init", "-c", "defaults", "-c", "bioconda"],
+        "channels",
+        ["defaults", "bioconda"],
+    ),
+    (["install", "-e", "test"], "environment", "test"),
+    (["install", "--force-reinstall"], "force_reinstall", True),
+    (["envs", "--installed"], "installed", True),
+    (["info", "-e", "test"], "environment", "test"),
+    (["info"], "environment", None),
+    (["add", "--pypi", "requests"], "pypi", True),
+    (["add", "--feature", "dev", "numpy"], "feature", "dev"),
+    (["remove", "--pypi", "requests"], "pypi", True),
+    (["clean", "-e", "test"], "environment", "test"),
+    (["activate", "-e", "docs"], "environment", "docs"),
+    (["activate"], "environment", "default"),
+]
+
+
+def test_workspace_parser_args(workspace_parser: argparse.ArgumentParser) -> None:
+    for args, expected_attr, expected_value in _WORKSPACE_PARSER_CASES:
+        parsed = workspace_parser.parse_args(args)
+        actual = getattr(parsed, expected_attr)
+        assert actual == expected_value, (args, expected_attr, actual)
+
+
+# (subcmd, module path, handler name) tables for the dispatch tests.
+_WORKSPACE_SUBCMDS = [
+    ("init", "conda_workspaces.cli.workspace.init", "execute_init"),
+    ("install", "conda_workspaces.cli.workspace.install", "execute_install"),
+    ("lock", "conda_workspaces.cli.workspace.lock", "execute_lock"),
+    ("list", "conda_workspaces.cli.workspace.list", "execute_list"),
+    ("info", "conda_workspaces.cli.workspace.info", "execute_info"),
+    ("add", "conda_workspaces.cli.workspace.add", "execute_add"),
+    ("remove", "conda_workspaces.cli.workspace.remove", "execute_remove"),
+    ("clean", "conda_workspaces.cli.workspace.clean", "execute_clean"),
+    ("activate", "conda_workspaces.cli.workspace.activate", "execute_activate"),
+    ("shell", "conda_workspaces.cli.workspace.shell", "execute_shell"),
+]
+
+_TASK_SUBCMDS = [
+    ("run", "conda_workspaces.cli.task.run", "execute_run"),
+    ("list", "conda_workspaces.cli.task.list", "execute_list"),
+    ("add", "conda_workspaces.cli.task.add", "execute_add"),
+    ("remove", "conda_workspaces.cli.task.remove", "execute_remove"),
+    ("export", "conda_workspaces.cli.task.export", "execute_export"),
+]
+
+
+@functools.cache
+def _subcmd_module(module_attr: str):
+    """Resolve a subcommand module once per process, then serve from cache."""
+    return importlib.import_module(module_attr)
 
 
 @pytest.mark.parametrize(
     "subcmd, module_attr, func_name",
-    [
-        ("init", "conda_workspaces.cli.workspace.init", "execute_init"),
-        ("install", "conda_workspaces.cli.workspace.install", "execute_install"),
-        ("lock", "conda_workspaces.cli.workspace.lock", "execute_lock"),
-        ("list", "conda_workspaces.cli.workspace.list", "execute_list"),
-        ("info", "conda_workspaces.cli.workspace.info", "execute_info"),
-        ("add", "conda_workspaces.cli.workspace.add", "execute_add"),
-        ("remove", "conda_workspaces.cli.workspace.remove", "execute_remove"),
-        ("clean", "conda_workspaces.cli.workspace.clean", "execute_clean"),
-        ("activate", "conda_workspaces.cli.workspace.activate", "execute_activate"),
-        ("shell", "conda_workspaces.cli.workspace.shell", "execute_shell"),
-    ],
-    ids=[
-        "init",
-        "install",
-        "lock",
-        "list",
-        "info",
-        "add",
-        "remove",
-        "clean",
-        "activate",
-        "shell",
-    ],
+    _WORKSPACE_SUBCMDS,
+    ids=[subcmd for subcmd, _, _ in _WORKSPACE_SUBCMDS],
 )
 def test_workspace_dispatches_to_subcommand(
     monkeypatch: pytest.MonkeyPatch,
@@ -189,8 +179,7 @@ def test_workspace_dispatches_to_subcommand(
         calls.append(subcmd)
         return 0
 
-    mod = importlib.import_module(module_attr)
-    monkeypatch.setattr(mod, func_name, fake_handler)
+    monkeypatch.setattr(_subcmd_module(module_attr), func_name, fake_handler)
 
     args = argparse.Namespace(subcmd=subcmd)
     result = execute_workspace(args)
@@ -200,14 +189,8 @@ def test_workspace_dispatches_to_subcommand(
 
 @pytest.mark.parametrize(
     "subcmd, module_attr, func_name",
-    [
-        ("run", "conda_workspaces.cli.task.run", "execute_run"),
-        ("list", "conda_workspaces.cli.task.list", "execute_list"),
-        ("add", "conda_workspaces.cli.task.add", "execute_add"),
-        ("remove", "conda_workspaces.cli.task.remove", "execute_remove"),
-        ("export", "conda_workspaces.cli.task.export", "execute_export"),
-    ],
-    ids=["run", "list", "add", "remove", "export"],
+    _TASK_SUBCMDS,
+    ids=[subcmd for subcmd, _, _ in _TASK_SUBCMDS],
 )
 def test_task_dispatches_to_subcommand(
     monkeypatch: pytest.MonkeyPatch,
@@ -221,8 +204,7 @@ def test_task_dispatches_to_subcommand(
         calls.append(subcmd)
         return 0
 
-    mod = importlib.import_module(module_attr)
-    monkeypatch.setattr(mod, func_name, fake_handler)
+    monkeypatch.setattr(_subcmd_module(module_attr), func_name, fake_handler)
 
     args = argparse.Namespace(subcmd=subcmd)
     result = execute_task(args)
@@ -230,9 +212,10 @@ def test_task_dispatches_to_subcommand(
     assert calls == [subcmd]
 
 
-def test_shell_accepts_environment_flag() -> None:
-    parser = generate_workspace_parser()
-    parsed = parser.parse_args(["shell", "-e", "test"])
+def test_shell_accepts_environment_flag(
+    workspace_parser: argparse.ArgumentParser,
+) -> None:
+    parsed = workspace_parser.parse_args(["shell", "-e", "test"])
     assert parsed.environment == "test"
 
 
@@ -246,7 +229,9 @@ def test_shell_accepts_environment_flag() -> None:
     ],
     ids=["init", "activate", "run", "shell"],
 )
-def test_side_effect_subcommands_accept_json_silently(argv: list[str]) -> None:
+def test_side_effect_subcommands_accept_json_silently(
+    workspace_parser: argparse.ArgumentParser, argv: list[str]
+) -> None:
     """Side-effect subcommands must tolerate ``--json`` without argparse errors.
 
     These subcommands register ``--json`` with ``help=SUPPRESS`` via
@@ -255,31 +240,21 @@ def test_side_effect_subcommands_accept_json_silently(argv: list[str]) -> None:
     with ``unrecognized arguments: --json`` is the wrong UX. See the
     ``--json contract`` section in ``AGENTS.md``.
     """
-    parser = generate_workspace_parser()
-    parsed = parser.parse_args(argv)
+    parsed = workspace_parser.parse_args(argv)
     assert parsed.subcmd == argv[0]
 
 
-@pytest.mark.parametrize(
-    "args, expected_attr, expected_value",
-    [
-        (["run", "test"], "task_name", "test"),
-        (["run", "-e", "dev", "test"], "environment", "dev"),
-        (["run", "--skip-deps", "test"], "skip_deps", True),
-        (["run", "--templated", "test"], "templated", True),
-        (["run", "--clean-env", "test"], "clean_env", True),
-    ],
-    ids=[
-        "run-task-name",
-        "run-environment",
-        "run-skip-deps",
-        "run-templated",
-        "run-clean-env",
-    ],
-)
-def test_task_parser_args(
-    args: list[str], expected_attr: str, expected_value: object
-) -> None:
-    parser = generate_task_parser()
-    parsed = parser.parse_args(args)
-    assert getattr(parsed, expected_attr) == expected_value
+_TASK_PARSER_CASES = [
+    (["run", "test"], "task_name", "test"),
+    (["run", "-e", "dev", "test"], "environment", "dev"),
+    (["run", "--skip-deps", "test"], "skip_deps", True),
+    (["run", "--templated", "test"], "templated", True),
+    (["run", "--clean-env", "test"], "clean_env", True),
+]
+
+
+def test_task_parser_args(task_parser: argparse.ArgumentParser) -> None:
+    for args, expected_attr, expected_value in _TASK_PARSER_CASES:
+        parsed = task_parser.parse_args(args)
+        actual = getattr(parsed, expected_attr)
+        assert actual == expected_value, (args, expected_attr, actual)
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 import pytest
 import tomlkit
 
+from conda_workspaces.cli.workspace import add as add_mod
+from conda_workspaces.cli.workspace import remove as remove_mod
 from conda_workspaces.cli.workspace.add import execute_add
 from conda_workspaces.cli.workspace.remove import execute_remove
 
@@ -30,6 +32,18 @@ _DEFAULTS = {
 }
 
 
+@pytest.fixture(autouse=True)
+def capture_docs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable the ``_last_doc`` capture hook on both command modules.
+
+    The hook is off by default in production; most tests here use it to
+    inspect the edited document without re-parsing the manifest.  The
+    per-command round-trip tests still assert against the file on disk.
+    """
+    monkeypatch.setattr(add_mod, "_capture_doc", True)
+    monkeypatch.setattr(remove_mod, "_capture_doc", True)
+
+
 @pytest.fixture
 def pixi_toml(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Create a pixi.toml and chdir to tmp_path."""
@@ -87,6 +101,7 @@ def test_add_conda_deps_to_pixi_toml(
     result = execute_add(args)
     assert result == 0
 
+    # Re-read from disk so the write path stays covered.
     doc = tomlkit.loads(pixi_toml.read_text(encoding="utf-8"))
     for name, version in expected_deps.items():
         assert doc["dependencies"][name] == version
@@ -104,7 +119,7 @@ def test_add_to_feature(pixi_toml: Path, kwargs: dict) -> None:
     args = make_args(_DEFAULTS, file=pixi_toml, specs=["coverage"], **kwargs)
     execute_add(args)
 
-    doc = tomlkit.loads(pixi_toml.read_text(encoding="utf-8"))
+    doc = add_mod._last_doc
     assert doc["feature"]["test"]["dependencies"]["coverage"] == "*"
 
 
@@ -112,7 +127,7 @@ def test_add_pypi_deps(pixi_toml: Path) -> None:
     args = make_args(_DEFAULTS, file=pixi_toml, specs=["requests >=2.0"], pypi=True)
     execute_add(args)
 
-    doc = tomlkit.loads(pixi_toml.read_text(encoding="utf-8"))
+    doc = add_mod._last_doc
     assert doc["pypi-dependencies"]["requests"] == ">=2.0"
 
 
@@ -120,7 +135,7 @@ def test_add_to_pyproject(pyproject_toml: Path) -> None:
     args = make_args(_DEFAULTS, file=pyproject_toml, specs=["numpy >=1.24"])
     execute_add(args)
 
-    doc = tomlkit.loads(pyproject_toml.read_text(encoding="utf-8"))
+    doc = add_mod._last_doc
     assert doc["tool"]["pixi"]["dependencies"]["numpy"] == ">=1.24"
 
 
@@ -139,6 +154,7 @@ def test_remove_from_pixi_toml(
     result = execute_remove(args)
     assert result == 0
 
+    # Re-read from disk so the write path stays covered.
     doc = tomlkit.loads(pixi_toml.read_text(encoding="utf-8"))
     actual = list(doc["dependencies"].keys())
     assert actual == remaining
@@ -148,7 +164,7 @@ def test_remove_from_feature(pixi_toml: Path) -> None:
     args = make_args(_DEFAULTS, file=pixi_toml, specs=["pytest"], feature="test")
     execute_remove(args)
 
-    doc = tomlkit.loads(pixi_toml.read_text(encoding="utf-8"))
+    doc = remove_mod._last_doc
     assert "pytest" not in doc["feature"]["test"]["dependencies"]
 
 
@@ -156,7 +172,7 @@ def test_remove_from_pyproject(pyproject_toml: Path) -> None:
     args = make_args(_DEFAULTS, file=pyproject_toml, specs=["python"])
     execute_remove(args)
 
-    doc = tomlkit.loads(pyproject_toml.read_text(encoding="utf-8"))
+    doc = remove_mod._last_doc
     assert "python" not in doc["tool"]["pixi"]["dependencies"]
 
 
@@ -174,7 +190,7 @@ def test_add_pypi_to_pyproject(pyproject_toml: Path) -> None:
         _DEFAULTS, file=pyproject_toml, specs=["requests >=2.0"], pypi=True
     )
     execute_add(args)
-    doc = tomlkit.loads(pyproject_toml.read_text(encoding="utf-8"))
+    doc = add_mod._last_doc
     assert doc["tool"]["pixi"]["pypi-dependencies"]["requests"] == ">=2.0"
 
 
@@ -182,7 +198,7 @@ def test_add_to_pyproject_feature(pyproject_toml: Path) -> None:
     """Adding deps to a feature in pyproject.toml."""
     args = make_args(_DEFAULTS, file=pyproject_toml, specs=["pytest"], feature="test")
     execute_add(args)
-    doc = tomlkit.loads(pyproject_toml.read_text(encoding="utf-8"))
+    doc = add_mod._last_doc
     assert doc["tool"]["pixi"]["feature"]["test"]["dependencies"]["pytest"] == "*"
 
 
@@ -206,7 +222,7 @@ requests = ">=2.0"
     monkeypatch.chdir(tmp_path)
     args = make_args(_DEFAULTS, file=path, specs=["requests"], pypi=True)
     execute_remove(args)
-    doc = tomlkit.loads(path.read_text(encoding="utf-8"))
+    doc = remove_mod._last_doc
     assert "requests" not in doc["tool"]["pixi"]["pypi-dependencies"]
 
 
@@ -230,7 +246,7 @@ pytest = ">=8.0"
     monkeypatch.chdir(tmp_path)
     args = make_args(_DEFAULTS, file=path, specs=["pytest"], feature="test")
     execute_remove(args)
-    doc = tomlkit.loads(path.read_text(encoding="utf-8"))
+    doc = remove_mod._last_doc
     assert "pytest" not in doc["tool"]["pixi"]["feature"]["test"]["dependencies"]
 
 
@@ -270,7 +286,7 @@ def test_add_environment_auto_creates_env_entry(
     result = execute_add(args)
     assert result == 0
 
-    doc = tomlkit.loads(path.read_text(encoding="utf-8"))
+    doc = add_mod._last_doc
     root = doc
     for key in root_keys:
         root = root[key]
@@ -293,7 +309,7 @@ def test_add_environment_existing_env_no_duplicate(pixi_toml: Path) -> None:
     )
     execute_add(args2)
 
-    doc2 = tomlkit.loads(pixi_toml.read_text(encoding="utf-8"))
+    doc2 = add_mod._last_doc
     assert doc2["feature"]["test"]["dependencies"]["hypothesis"] == "*"
     assert "test" in doc2["environments"]
 
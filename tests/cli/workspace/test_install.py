@@ -25,14 +25,6 @@ _DEFAULTS = {
 }
 
 
-def _stub_lockfile(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Stub generate_lockfile to a no-op for tests that don't care about it."""
-    monkeypatch.setattr(
-        "conda_workspaces.cli.workspace.sync.generate_lockfile",
-        lambda ctx, resolved_envs: None,
-    )
-
-
 @pytest.mark.parametrize(
     "env_arg, expected_names, output_fragment",
     [
@@ -45,12 +37,11 @@ def test_install_envs(
     pixi_workspace: Path,
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
+    lock_calls: list[dict],
     env_arg: str | None,
     expected_names: set[str],
     output_fragment: str,
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
-
     calls: list[str] = []
 
     def fake_install(ctx, resolved, *, force_reinstall=False, dry_run=False):
@@ -60,13 +51,7 @@ def test_install_envs(
         "conda_workspaces.cli.workspace.sync.install_environment", fake_install
     )
 
-    lock_calls: list[dict] = []
-    monkeypatch.setattr(
-        "conda_workspaces.cli.workspace.sync.generate_lockfile",
-        lambda ctx, resolved_envs: lock_calls.append(resolved_envs),
-    )
-
-    args = make_args(_DEFAULTS, environment=env_arg)
+    args = make_args(_DEFAULTS, file=pixi_workspace / "pixi.toml", environment=env_arg)
     result = execute_install(args)
     assert result == 0
     assert set(calls) == expected_names
@@ -87,12 +72,10 @@ def test_install_envs(
 def test_install_flags_forwarded(
     pixi_workspace: Path,
     monkeypatch: pytest.MonkeyPatch,
+    lock_calls: list[dict],
     force: bool,
     dry_run: bool,
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
-    _stub_lockfile(monkeypatch)
-
     recorded: list[tuple[bool, bool]] = []
 
     def fake_install(ctx, resolved, *, force_reinstall=False, dry_run=False):
@@ -104,6 +87,7 @@ def test_install_flags_forwarded(
 
     args = make_args(
         _DEFAULTS,
+        file=pixi_workspace / "pixi.toml",
         environment="default",
         force_reinstall=force,
         dry_run=dry_run,
@@ -115,21 +99,19 @@ def test_install_flags_forwarded(
 def test_install_dry_run_skips_lockfile(
     pixi_workspace: Path,
     monkeypatch: pytest.MonkeyPatch,
+    lock_calls: list[dict],
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
-
     monkeypatch.setattr(
         "conda_workspaces.cli.workspace.sync.install_environment",
         lambda ctx, resolved, **kw: None,
     )
 
-    lock_calls: list[dict] = []
-    monkeypatch.setattr(
-        "conda_workspaces.cli.workspace.sync.generate_lockfile",
-        lambda ctx, resolved_envs: lock_calls.append(resolved_envs),
+    args = make_args(
+        _DEFAULTS,
+        file=pixi_workspace / "pixi.toml",
+        environment="default",
+        dry_run=True,
     )
-
-    args = make_args(_DEFAULTS, environment="default", dry_run=True)
     execute_install(args)
     assert lock_calls == []
 
@@ -150,15 +132,18 @@ def test_install_frozen(
     expected_names: set[str],
     output_fragment: str,
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
-
     locked_calls: list[str] = []
     monkeypatch.setattr(
         "conda_workspaces.cli.workspace.install.install_from_lockfile",
         lambda ctx, name: locked_calls.append(name),
     )
 
-    args = make_args(_DEFAULTS, environment=env_arg, frozen=True)
+    args = make_args(
+        _DEFAULTS,
+        file=pixi_workspace / "pixi.toml",
+        environment=env_arg,
+        frozen=True,
+    )
     result = execute_install(args)
     assert result == 0
     assert set(locked_calls) == expected_names
@@ -170,8 +155,6 @@ def test_install_locked_validates_freshness(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """--locked fails when lockfile is older than the manifest."""
-    monkeypatch.chdir(pixi_workspace)
-
     lock_file = pixi_workspace / "conda.lock"
     lock_file.write_text("version: 1\n", encoding="utf-8")
     time.sleep(0.05)
@@ -179,6 +162,6 @@ def test_install_locked_validates_freshness(
     manifest = pixi_workspace / "pixi.toml"
     manifest.write_text(manifest.read_text(encoding="utf-8"), encoding="utf-8")
 
-    args = make_args(_DEFAULTS, locked=True)
+    args = make_args(_DEFAULTS, file=manifest, locked=True)
     with pytest.raises(LockfileStaleError):
         execute_install(args)
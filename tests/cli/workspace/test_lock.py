@@ -71,16 +71,15 @@ def capture_generate_lockfile(monkeypatch: pytest.MonkeyPatch, pixi_workspace: P
 )
 def test_lock_envs(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
     capture_generate_lockfile: list[dict],
     env_arg: str | None,
     expected_keys: set[str],
     output_fragment: str,
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
-
-    result = execute_lock(make_args(_DEFAULTS, environment=env_arg))
+    result = execute_lock(
+        make_args(_DEFAULTS, file=pixi_workspace / "pixi.toml", environment=env_arg)
+    )
     assert result == 0
     assert len(capture_generate_lockfile) == 1
     assert set(capture_generate_lockfile[0]["resolved_envs"].keys()) == expected_keys
@@ -88,38 +87,43 @@ def test_lock_envs(
     assert output_fragment in capsys.readouterr().out
 
 
-def test_lock_unknown_env(
-    pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    monkeypatch.chdir(pixi_workspace)
-
+def test_lock_unknown_env(pixi_workspace: Path) -> None:
     with pytest.raises(EnvironmentNotFoundError):
-        execute_lock(make_args(_DEFAULTS, environment="nonexistent"))
+        execute_lock(
+            make_args(
+                _DEFAULTS,
+                file=pixi_workspace / "pixi.toml",
+                environment="nonexistent",
+            )
+        )
 
 
 def test_lock_forwards_platform_flag(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
     capture_generate_lockfile: list[dict],
 ) -> None:
     """Repeated ``--platform`` values reach ``generate_lockfile`` as a tuple."""
-    monkeypatch.chdir(pixi_workspace)
-
-    result = execute_lock(make_args(_DEFAULTS, platform=["linux-64", "osx-arm64"]))
+    result = execute_lock(
+        make_args(
+            _DEFAULTS,
+            file=pixi_workspace / "pixi.toml",
+            platform=["linux-64", "osx-arm64"],
+        )
+    )
     assert result == 0
     assert capture_generate_lockfile[0]["platforms"] == ("linux-64", "osx-arm64")
 
 
-def test_lock_rejects_undeclared_platform(
-    pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_lock_rejects_undeclared_platform(pixi_workspace: Path) -> None:
     """A ``--platform`` value absent from the manifest raises ``PlatformError``."""
-    monkeypatch.chdir(pixi_workspace)
-
     with pytest.raises(PlatformError, match="freebsd-64"):
-        execute_lock(make_args(_DEFAULTS, platform=["freebsd-64"]))
+        execute_lock(
+            make_args(
+                _DEFAULTS,
+                file=pixi_workspace / "pixi.toml",
+                platform=["freebsd-64"],
+            )
+        )
 
 
 @pytest.mark.parametrize(
@@ -132,7 +136,6 @@ def test_lock_rejects_undeclared_platform(
 )
 def test_lock_forwards_skip_unsolvable(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
     capture_generate_lockfile: list[dict],
     flag_value: bool,
     expects_on_skip: bool,
@@ -142,9 +145,13 @@ def test_lock_forwards_skip_unsolvable(
     With the flag off (the default), the CLI must leave ``on_skip`` as
     ``None`` so ``generate_lockfile`` falls back to fail-fast.
     """
-    monkeypatch.chdir(pixi_workspace)
-
-    result = execute_lock(make_args(_DEFAULTS, skip_unsolvable=flag_value))
+    result = execute_lock(
+        make_args(
+            _DEFAULTS,
+            file=pixi_workspace / "pixi.toml",
+            skip_unsolvable=flag_value,
+        )
+    )
     assert result == 0
     assert capture_generate_lockfile[0]["skip_unsolvable"] is flag_value
     if expects_on_skip:
@@ -155,14 +162,14 @@ def test_lock_forwards_skip_unsolvable(
 
 def test_lock_forwards_output_path(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
     capture_generate_lockfile: list[dict],
 ) -> None:
     """``--output`` threads through to ``generate_lockfile(output_path=...)``."""
-    monkeypatch.chdir(pixi_workspace)
     target = pixi_workspace / "conda.lock.linux-64"
 
-    result = execute_lock(make_args(_DEFAULTS, output=target))
+    result = execute_lock(
+        make_args(_DEFAULTS, file=pixi_workspace / "pixi.toml", output=target)
+    )
     assert result == 0
     assert capture_generate_lockfile[0]["output_path"] == target
 
@@ -173,7 +180,6 @@ def test_lock_merge_dispatches_to_merge_lockfiles(
     capture_generate_lockfile: list[dict],
 ) -> None:
     """``--merge`` bypasses the solver and calls ``merge_lockfiles``."""
-    monkeypatch.chdir(pixi_workspace)
     frag1 = pixi_workspace / "conda.lock.linux-64"
     frag2 = pixi_workspace / "conda.lock.osx-arm64"
     frag1.write_text("placeholder", encoding="utf-8")
@@ -190,7 +196,11 @@ def test_lock_merge_dispatches_to_merge_lockfiles(
     )
 
     result = execute_lock(
-        make_args(_DEFAULTS, merge=[str(frag1), str(frag2)]),
+        make_args(
+            _DEFAULTS,
+            file=pixi_workspace / "pixi.toml",
+            merge=[str(frag1), str(frag2)],
+        ),
     )
     assert result == 0
     assert capture_generate_lockfile == []
@@ -236,11 +246,9 @@ def test_lock_merge_glob_expansion(
 )
 def test_lock_merge_rejects_incompatible_flags(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
     incompatible: dict,
 ) -> None:
     """``--merge`` is mutually exclusive with solver-side flags."""
-    monkeypatch.chdir(pixi_workspace)
     frag = pixi_workspace / "conda.lock.linux-64"
     frag.write_text("placeholder", encoding="utf-8")
     if "output" in incompatible:
@@ -248,7 +256,12 @@ def test_lock_merge_rejects_incompatible_flags(
 
     with pytest.raises(CondaValueError, match="--merge"):
         execute_lock(
-            make_args(_DEFAULTS, merge=[str(frag)], **incompatible),
+            make_args(
+                _DEFAULTS,
+                file=pixi_workspace / "pixi.toml",
+                merge=[str(frag)],
+                **incompatible,
+            ),
         )
 
 
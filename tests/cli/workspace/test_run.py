@@ -13,15 +13,14 @@ from conda_workspaces.exceptions import (
 )
 
 
-def test_run_no_command_raises(pixi_workspace, monkeypatch, tmp_workspace_env):
+def test_run_no_command_raises(pixi_workspace, tmp_workspace_env):
     """Running without a command raises CondaWorkspacesError."""
     from conda_workspaces.cli.workspace.run import execute_run
 
-    monkeypatch.chdir(pixi_workspace)
     tmp_workspace_env(pixi_workspace, "default")
 
     args = argparse.Namespace(
-        file=None,
+        file=pixi_workspace / "pixi.toml",
         environment="default",
         cmd=[],
     )
@@ -37,14 +36,12 @@ def test_run_no_command_raises(pixi_workspace, monkeypatch, tmp_workspace_env):
     ],
     ids=["undefined-env", "not-installed"],
 )
-def test_run_env_error_raises(pixi_workspace, monkeypatch, env_name, expected_exc):
+def test_run_env_error_raises(pixi_workspace, env_name, expected_exc):
     """Running with an invalid environment raises the appropriate error."""
     from conda_workspaces.cli.workspace.run import execute_run
 
-    monkeypatch.chdir(pixi_workspace)
-
     args = argparse.Namespace(
-        file=None,
+        file=pixi_workspace / "pixi.toml",
         environment=env_name,
         cmd=["echo", "hi"],
     )
@@ -52,51 +49,33 @@ def test_run_env_error_raises(pixi_workspace, monkeypatch, env_name, expected_ex
         execute_run(args)
 
 
-def test_run_strips_double_dash(pixi_workspace, monkeypatch, tmp_workspace_env):
+def test_run_strips_double_dash(pixi_workspace, tmp_workspace_env, conda_run_stub):
     """The leading '--' separator is stripped from the command."""
     from conda_workspaces.cli.workspace.run import execute_run
 
-    monkeypatch.chdir(pixi_workspace)
     tmp_workspace_env(pixi_workspace, "default")
 
-    called_with = []
-
-    def fake_conda_run(args, parser):
-        called_with.append(args.executable_call)
-        return 0
-
-    monkeypatch.setattr(
-        "conda.cli.main_run.execute",
-        fake_conda_run,
-    )
-
     args = argparse.Namespace(
-        file=None,
+        file=pixi_workspace / "pixi.toml",
         environment="default",
         cmd=["--", "echo", "hello"],
     )
     result = execute_run(args)
     assert result == 0
-    assert called_with[0] == ["echo", "hello"]
+    assert conda_run_stub[0] == ["echo", "hello"]
 
 
-def test_run_returns_nonzero_on_failure(pixi_workspace, monkeypatch, tmp_workspace_env):
+def test_run_returns_nonzero_on_failure(
+    pixi_workspace, tmp_workspace_env, conda_run_stub
+):
     """Non-zero exit from conda run is propagated."""
     from conda_workspaces.cli.workspace.run import execute_run
 
-    monkeypatch.chdir(pixi_workspace)
     tmp_workspace_env(pixi_workspace, "default")
 
-    def fake_conda_run(args, parser):
-        return 42
-
-    monkeypatch.setattr(
-        "conda.cli.main_run.execute",
-        fake_conda_run,
-    )
-
+    conda_run_stub.rc = 42
     args = argparse.Namespace(
-        file=None,
+        file=pixi_workspace / "pixi.toml",
         environment="default",
         cmd=["false"],
     )
@@ -19,41 +19,37 @@ if TYPE_CHECKING:
 
     from tests.conftest import CreateWorkspaceEnv
 
+    from ..conftest import _SpawnCalls
+
 _DEFAULTS = {"file": None, "environment": "default", "cmd": []}
 
+# Passing file= explicitly (instead of monkeypatch.chdir) keeps these tests
+# free of process-global cwd churn.
+
 
 @pytest.mark.parametrize(
-    "env_name, expected_path_part",
+    "installed_env, expected_path_part",
     [
         ("default", "default"),
         ("test", "test"),
     ],
+    indirect=["installed_env"],
     ids=["default-env", "named-env"],
 )
 def test_shell_spawns_env(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_workspace_env: CreateWorkspaceEnv,
-    env_name: str,
+    spawn_stub: _SpawnCalls,
+    installed_env: str,
     expected_path_part: str,
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
-    tmp_workspace_env(pixi_workspace, env_name)
-
-    spawn_calls: list[dict] = []
-
-    def fake_spawn(*, prefix, command=None):
-        spawn_calls.append({"prefix": prefix, "command": command})
-        return 0
-
-    monkeypatch.setattr("conda_spawn.main.spawn", fake_spawn)
-
-    args = make_args(_DEFAULTS, environment=env_name)
+    args = make_args(
+        _DEFAULTS, file=pixi_workspace / "pixi.toml", environment=installed_env
+    )
     result = execute_shell(args)
     assert result == 0
-    assert len(spawn_calls) == 1
-    assert expected_path_part in str(spawn_calls[0]["prefix"])
-    assert spawn_calls[0]["command"] is None
+    assert len(spawn_stub) == 1
+    assert expected_path_part in spawn_stub[0]["prefix"]
+    assert spawn_stub[0]["command"] is None
 
 
 @pytest.mark.parametrize(
@@ -68,26 +64,17 @@ def test_shell_spawns_env(
 )
 def test_shell_command_passthrough(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
     tmp_workspace_env: CreateWorkspaceEnv,
+    spawn_stub: _SpawnCalls,
     cmd_input: list[str],
     expected_command: list[str] | None,
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
     tmp_workspace_env(pixi_workspace, "default")
 
-    spawn_calls: list[dict] = []
-
-    def fake_spawn(*, prefix, command=None):
-        spawn_calls.append({"prefix": prefix, "command": command})
-        return 0
-
-    monkeypatch.setattr("conda_spawn.main.spawn", fake_spawn)
-
-    args = make_args(_DEFAULTS, cmd=cmd_input)
+    args = make_args(_DEFAULTS, file=pixi_workspace / "pixi.toml", cmd=cmd_input)
     result = execute_shell(args)
     assert result == 0
-    assert spawn_calls[0]["command"] == expected_command
+    assert spawn_stub[0]["command"] == expected_command
 
 
 @pytest.mark.parametrize(
@@ -100,28 +87,21 @@ def test_shell_command_passthrough(
 )
 def test_shell_error(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
     env_name: str,
     exc_type: type,
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
-    args = make_args(_DEFAULTS, environment=env_name)
+    args = make_args(_DEFAULTS, file=pixi_workspace / "pixi.toml", environment=env_name)
     with pytest.raises(exc_type):
         execute_shell(args)
 
 
 def test_shell_propagates_exit_code(
     pixi_workspace: Path,
-    monkeypatch: pytest.MonkeyPatch,
     tmp_workspace_env: CreateWorkspaceEnv,
+    spawn_stub: _SpawnCalls,
 ) -> None:
-    monkeypatch.chdir(pixi_workspace)
     tmp_workspace_env(pixi_workspace, "default")
 
-    def fake_spawn(*, prefix, command=None):
-        return 42
-
-    monkeypatch.setattr("conda_spawn.main.spawn", fake_spawn)
-
-    args = make_args(_DEFAULTS)
+    spawn_stub.rc = 42
+    args = make_args(_DEFAULTS, file=pixi_workspace / "pixi.toml")
     assert execute_shell(args) == 42
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 pytest_plugins = ["conda.testing", "conda.testing.fixtures"]
 
+import os
 from contextlib import ExitStack
 from typing import TYPE_CHECKING, Protocol
 
@@ -13,11 +14,11 @@ from conda_workspaces.models import (
     Channel,
     Environment,
     Feature,
-    MatchSpec,
     Task,
     TaskDependency,
     TaskOverride,
     WorkspaceConfig,
+    match_spec,
 )
 
 if TYPE_CHECKING:
@@ -33,10 +34,11 @@ class CreateWorkspaceEnv(Protocol):
     def __call__(self, workspace: Path, name: str, *, pkg_count: int = 0) -> Path: ...
 
 
-@pytest.fixture
-def sample_pixi_toml(tmp_path: Path) -> Path:
-    """Create a minimal pixi.toml in tmp_path and return its path."""
-    content = """\
+@pytest.fixture(scope="session")
+def _sample_pixi_toml_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the shared pixi.toml fixture content once per session."""
+    # ASCII literal stored pre-encoded; write_bytes skips the str.encode step.
+    content = b"""\
 [workspace]
 name = "test-project"
 version = "0.1.0"
@@ -58,15 +60,28 @@ default = []
 test = {features = ["test"]}
 docs = {features = ["docs"]}
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = tmp_path_factory.mktemp("sample-pixi") / "pixi.toml"
+    path.write_bytes(content)
     return path
 
 
 @pytest.fixture
-def sample_pyproject_toml(tmp_path: Path) -> Path:
-    """Create a pyproject.toml with [tool.pixi.*] tables."""
-    content = """\
+def sample_pixi_toml(_sample_pixi_toml_template: Path, tmp_path: Path) -> Path:
+    """A minimal pixi.toml in tmp_path, hardlinked from the session template.
+
+    Tests only read the file, so sharing the inode is safe and skips the
+    per-test content write.
+    """
+    path = tmp_path / "pixi.toml"
+    os.link(_sample_pixi_toml_template, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def _sample_pyproject_toml_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the shared pyproject.toml fixture content once per session."""
+    # ASCII literal stored pre-encoded; write_bytes skips the str.encode step.
+    content = b"""\
 [project]
 name = "my-project"
 version = "1.0.0"
@@ -85,31 +100,69 @@ pytest-cov = ">=4.0"
 [tool.pixi.environments]
 test = {features = ["test"]}
 """
-    path = tmp_path / "pyproject.toml"
-    path.write_text(content, encoding="utf-8")
+    path = tmp_path_factory.mktemp("sample-pyproject") / "pyproject.toml"
+    path.write_bytes(content)
     return path
 
 
 @pytest.fixture
+def sample_pyproject_toml(
+    _sample_pyproject_toml_template: Path, tmp_path: Path
+) -> Path:
+    """A pyproject.toml with [tool.pixi.*] tables, hardlinked per test."""
+    path = tmp_path / "pyproject.toml"
+    os.link(_sample_pyproject_toml_template, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def toml_corpus() -> dict[str, bytes]:
+    """Canonical conda.toml bodies, pre-encoded once per session.
+
+    Tests that need one of these on disk write it with ``write_bytes``,
+    so repeated parametrized cases share the literals instead of
+    rebuilding and re-encoding the same content per test.
+    """
+    basic = (
+        b'[workspace]\nname = "my-workspace"\n'
+        b'channels = ["conda-forge"]\nplatforms = ["linux-64"]\n'
+    )
+    deps = basic + b'\n[dependencies]\npython = ">=3.10"\n'
+    return {
+        "workspace_basic": basic,
+        "workspace_deps": deps,
+        "workspace_pypi_deps": deps + b'\n[pypi-dependencies]\nrequests = "*"\n',
+        "workspace_unnamed_deps": (
+            b'[workspace]\nchannels = ["conda-forge"]\nplatforms = ["linux-64"]\n'
+            b'\n[dependencies]\npython = ">=3.10"\n'
+        ),
+    }
+
+
+@pytest.fixture(scope="session")
 def sample_config() -> WorkspaceConfig:
-    """Return a pre-built WorkspaceConfig for unit tests."""
+    """Return a pre-built WorkspaceConfig for unit tests.
+
+    Session-scoped: tests treat the config as read-only, so the repeated
+    Feature/MatchSpec construction cost is paid once.
+    """
     default_feat = Feature(
         name="default",
         conda_dependencies={
-            "python": MatchSpec("python >=3.10"),
-            "numpy": MatchSpec("numpy >=1.24"),
+            "python": match_spec("python >=3.10"),
+            "numpy": match_spec("numpy >=1.24"),
         },
     )
     test_feat = Feature(
         name="test",
         conda_dependencies={
-            "pytest": MatchSpec("pytest >=8.0"),
+            "pytest": match_spec("pytest >=8.0"),
         },
     )
     docs_feat = Feature(
         name="docs",
         conda_dependencies={
-            "sphinx": MatchSpec("sphinx >=7.0"),
+            "sphinx": match_spec("sphinx >=7.0"),
         },
     )
 
@@ -148,8 +201,9 @@ def tmp_workspace_env(tmp_env: TmpEnvFixture) -> Iterator[CreateWorkspaceEnv]:
         prefix = stack.enter_context(
             tmp_env(shallow=True, prefix=workspace / ".conda" / "envs" / name)
         )
+        meta = prefix / "conda-meta"
         for i in range(pkg_count):
-            (prefix / "conda-meta" / f"pkg-{i}.json").write_text("{}", encoding="utf-8")
+            (meta / f"pkg-{i}.json").write_bytes(b"{}")
         return prefix
 
     with stack:
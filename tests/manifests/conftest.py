@@ -6,9 +6,47 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from conda_workspaces.manifests.pixi_toml import PixiTomlParser
+from conda_workspaces.manifests.pyproject_toml import PyprojectTomlParser
+
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from conda_workspaces.models import WorkspaceConfig
+
+
+@pytest.fixture(scope="session")
+def sample_pixi_config(_sample_pixi_toml_template: Path) -> WorkspaceConfig:
+    """Parse the session pixi.toml template once for read-only assertions.
+
+    Tests that only inspect the resulting ``WorkspaceConfig`` share this
+    single parse instead of re-tokenizing the same file per test; tests
+    that write or mutate manifests keep using ``sample_pixi_toml``.
+    """
+    return PixiTomlParser().parse(_sample_pixi_toml_template)
+
+
+@pytest.fixture(scope="session")
+def sample_pyproject_config(_sample_pyproject_toml_template: Path) -> WorkspaceConfig:
+    """Parse the session pyproject.toml template once (see sample_pixi_config)."""
+    return PyprojectTomlParser().parse(_sample_pyproject_toml_template)
+
+
+@pytest.fixture
+def write_toml(tmp_path: Path):
+    """Write an inline TOML body into tmp_path and return the path.
+
+    One shared code path for the encode+write dance the inline-content
+    tests repeat, storing pre-encoded bytes in a single call.
+    """
+
+    def _write(name: str, body: str) -> Path:
+        path = tmp_path / name
+        path.write_bytes(body.encode())
+        return path
+
+    return _write
+
 
 @pytest.fixture
 def task_pixi_toml(tmp_project: Path) -> Path:
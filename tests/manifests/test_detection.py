@@ -14,6 +14,7 @@ from conda_workspaces.exceptions import (
 from conda_workspaces.manifests import (
     _cached_parse,
     detect_and_parse,
+    detect_and_parse_many,
     detect_and_parse_tasks,
     detect_task_file,
     detect_workspace_file,
@@ -115,6 +116,18 @@ def test_detect_and_parse(sample_pixi_toml):
     assert config.name == "test-project"
 
 
+def test_detect_and_parse_many(sample_pixi_toml, tmp_path):
+    roots = []
+    for i in range(3):
+        sub = tmp_path / f"proj{i}"
+        sub.mkdir()
+        (sub / "pixi.toml").write_bytes(sample_pixi_toml.read_bytes())
+        roots.append(sub)
+    results = detect_and_parse_many(roots)
+    assert [path.parent.name for path, _ in results] == ["proj0", "proj1", "proj2"]
+    assert all(config.name == "test-project" for _, config in results)
+
+
 def test_detect_and_parse_not_found(tmp_path):
     with pytest.raises(WorkspaceNotFoundError):
         detect_and_parse(tmp_path)
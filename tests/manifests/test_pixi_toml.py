@@ -46,8 +46,8 @@ def test_has_workspace_false(parser, tmp_path, content):
     assert not parser.has_workspace(path)
 
 
-def test_parse_basic(parser, sample_pixi_toml):
-    config = parser.parse(sample_pixi_toml)
+def test_parse_basic(sample_pixi_config):
+    config = sample_pixi_config
     assert config.name == "test-project"
     assert config.version == "0.1.0"
     assert len(config.channels) == 1
@@ -56,24 +56,23 @@ def test_parse_basic(parser, sample_pixi_toml):
     assert "osx-arm64" in config.platforms
 
 
-def test_parse_default_dependencies(parser, sample_pixi_toml):
-    config = parser.parse(sample_pixi_toml)
-    default = config.features["default"]
+def test_parse_default_dependencies(sample_pixi_config):
+    default = sample_pixi_config.features["default"]
     assert "python" in default.conda_dependencies
     assert str(default.conda_dependencies["python"].version) == ">=3.10"
     assert "numpy" in default.conda_dependencies
 
 
-def test_parse_features(parser, sample_pixi_toml):
-    config = parser.parse(sample_pixi_toml)
+def test_parse_features(sample_pixi_config):
+    config = sample_pixi_config
     assert "test" in config.features
     assert "docs" in config.features
     test_feat = config.features["test"]
     assert "pytest" in test_feat.conda_dependencies
 
 
-def test_parse_environments(parser, sample_pixi_toml):
-    config = parser.parse(sample_pixi_toml)
+def test_parse_environments(sample_pixi_config):
+    config = sample_pixi_config
     assert "default" in config.environments
     assert "test" in config.environments
     assert "docs" in config.environments
@@ -81,7 +80,7 @@ def test_parse_environments(parser, sample_pixi_toml):
     assert test_env.features == ["test"]
 
 
-def test_parse_with_targets(tmp_path):
+def test_parse_with_targets(write_toml):
     content = """\
 [workspace]
 name = "target-test"
@@ -94,8 +93,7 @@ python = ">=3.10"
 [target.linux-64.dependencies]
 gcc = ">=12"
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
 
     parser = PixiTomlParser()
     config = parser.parse(path)
@@ -104,7 +102,7 @@ gcc = ">=12"
     assert "gcc" in default.target_conda_dependencies["linux-64"]
 
 
-def test_parse_with_pypi_deps(tmp_path):
+def test_parse_with_pypi_deps(write_toml):
     content = """\
 [workspace]
 name = "pypi-test"
@@ -117,8 +115,7 @@ python = ">=3.10"
 [pypi-dependencies]
 requests = ">=2.28"
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
 
     parser = PixiTomlParser()
     config = parser.parse(path)
@@ -126,7 +123,7 @@ requests = ">=2.28"
     assert "requests" in default.pypi_dependencies
 
 
-def test_parse_activation(tmp_path):
+def test_parse_activation(write_toml):
     content = """\
 [workspace]
 name = "activation-test"
@@ -139,8 +136,7 @@ scripts = ["setup.sh"]
 [activation.env]
 MY_VAR = "hello"
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
 
     parser = PixiTomlParser()
     config = parser.parse(path)
@@ -149,7 +145,7 @@ MY_VAR = "hello"
     assert default.activation_env == {"MY_VAR": "hello"}
 
 
-def test_parse_environment_as_list(tmp_path):
+def test_parse_environment_as_list(write_toml):
     content = """\
 [workspace]
 name = "list-env-test"
@@ -159,8 +155,7 @@ platforms = ["linux-64"]
 [environments]
 dev = ["test", "lint"]
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
 
     parser = PixiTomlParser()
     config = parser.parse(path)
@@ -175,15 +170,14 @@ dev = ["test", "lint"]
         pytest.param('[dependencies]\npython = ">=3.10"\n', id="no-workspace-table"),
     ],
 )
-def test_parse_error(parser, tmp_path, content):
+def test_parse_error(parser, write_toml, content):
     """Malformed TOML or missing [workspace] raises WorkspaceParseError."""
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
     with pytest.raises(WorkspaceParseError):
         parser.parse(path)
 
 
-def test_parse_system_requirements(tmp_path):
+def test_parse_system_requirements(write_toml):
     """Top-level system-requirements are parsed into the default feature."""
     content = """\
 [workspace]
@@ -195,14 +189,13 @@ platforms = ["linux-64"]
 linux = "5.10"
 cuda = "12.0"
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
     config = PixiTomlParser().parse(path)
     default = config.features["default"]
     assert default.system_requirements == {"linux": "5.10", "cuda": "12.0"}
 
 
-def test_parse_feature_system_requirements(tmp_path):
+def test_parse_feature_system_requirements(write_toml):
     """Feature-level system-requirements are parsed."""
     content = """\
 [workspace]
@@ -216,13 +209,12 @@ cudatoolkit = "*"
 [feature.gpu.system-requirements]
 cuda = "11.8"
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
     config = PixiTomlParser().parse(path)
     assert config.features["gpu"].system_requirements == {"cuda": "11.8"}
 
 
-def test_parse_feature_activation(tmp_path):
+def test_parse_feature_activation(write_toml):
     """Feature-level activation scripts and env vars are parsed."""
     content = """\
 [workspace]
@@ -236,15 +228,14 @@ scripts = ["dev-setup.sh"]
 [feature.dev.activation.env]
 DEBUG = "1"
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
     config = PixiTomlParser().parse(path)
     dev = config.features["dev"]
     assert dev.activation_scripts == ["dev-setup.sh"]
     assert dev.activation_env == {"DEBUG": "1"}
 
 
-def test_parse_returns_plain_str_values(tmp_path):
+def test_parse_returns_plain_str_values(write_toml):
     """Names/platforms/feature names are plain ``str``, not tomlkit subclasses.
 
     Regression guard for a lockfile-write failure: ``tomlkit.loads``
@@ -270,8 +261,7 @@ platforms = ["linux-64"]
 [environments]
 cuda = ["gpu"]
 """
-    path = tmp_path / "pixi.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pixi.toml", content)
     config = PixiTomlParser().parse(path)
 
     for platform in config.platforms:
@@ -47,30 +47,29 @@ def test_has_workspace_false(parser, tmp_path, content):
     assert not parser.has_workspace(path)
 
 
-def test_parse_basic(parser, sample_pyproject_toml):
-    config = parser.parse(sample_pyproject_toml)
+def test_parse_basic(sample_pyproject_config):
+    config = sample_pyproject_config
     assert config.name == "my-project"
     assert len(config.channels) == 1
     assert "linux-64" in config.platforms
 
 
-def test_parse_dependencies(parser, sample_pyproject_toml):
-    config = parser.parse(sample_pyproject_toml)
-    default = config.features["default"]
+def test_parse_dependencies(sample_pyproject_config):
+    default = sample_pyproject_config.features["default"]
     assert "python" in default.conda_dependencies
     assert str(default.conda_dependencies["python"].version) == ">=3.11"
 
 
-def test_parse_features(parser, sample_pyproject_toml):
-    config = parser.parse(sample_pyproject_toml)
+def test_parse_features(sample_pyproject_config):
+    config = sample_pyproject_config
     assert "test" in config.features
     test_feat = config.features["test"]
     assert "pytest" in test_feat.conda_dependencies
     assert "pytest-cov" in test_feat.conda_dependencies
 
 
-def test_parse_environments(parser, sample_pyproject_toml):
-    config = parser.parse(sample_pyproject_toml)
+def test_parse_environments(sample_pyproject_config):
+    config = sample_pyproject_config
     assert "test" in config.environments
     test_env = config.environments["test"]
     assert test_env.features == ["test"]
@@ -83,7 +82,7 @@ def test_parse_environments(parser, sample_pyproject_toml):
     ],
     ids=["conda-table"],
 )
-def test_alternative_tables(parser, tmp_path, table_key, dep_key):
+def test_alternative_tables(parser, write_toml, table_key, dep_key):
     content = f"""\
 [project]
 name = "alt-table-project"
@@ -95,8 +94,7 @@ platforms = ["linux-64"]
 [{dep_key}.dependencies]
 python = ">=3.12"
 """
-    path = tmp_path / "pyproject.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pyproject.toml", content)
 
     assert parser.has_workspace(path)
     config = parser.parse(path)
@@ -112,15 +110,14 @@ python = ">=3.12"
         pytest.param("{{invalid toml", id="bad-toml"),
     ],
 )
-def test_parse_error(parser, tmp_path, content):
+def test_parse_error(parser, write_toml, content):
     """Missing workspace or malformed TOML raises WorkspaceParseError."""
-    path = tmp_path / "pyproject.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pyproject.toml", content)
     with pytest.raises(WorkspaceParseError):
         parser.parse(path)
 
 
-def test_conda_table_priority_over_pixi(parser, tmp_path):
+def test_conda_table_priority_over_pixi(parser, write_toml):
     """[tool.conda] should win over [tool.pixi]."""
     content = """\
 [project]
@@ -140,8 +137,7 @@ platforms = ["win-64"]
 [tool.pixi.dependencies]
 python = ">=3.10"
 """
-    path = tmp_path / "pyproject.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pyproject.toml", content)
 
     config = parser.parse(path)
     # Should use conda table (>=3.12), not pixi (>=3.10)
@@ -149,7 +145,7 @@ python = ">=3.10"
     assert str(default.conda_dependencies["python"].version) == ">=3.12"
 
 
-def test_parse_activation(parser, tmp_path):
+def test_parse_activation(parser, write_toml):
     """Activation scripts and env vars are parsed."""
     content = """\
 [project]
@@ -168,15 +164,14 @@ scripts = ["setup.sh"]
 [tool.pixi.activation.env]
 MY_VAR = "hello"
 """
-    path = tmp_path / "pyproject.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pyproject.toml", content)
     config = parser.parse(path)
     default = config.features["default"]
     assert default.activation_scripts == ["setup.sh"]
     assert default.activation_env == {"MY_VAR": "hello"}
 
 
-def test_parse_system_requirements(parser, tmp_path):
+def test_parse_system_requirements(parser, write_toml):
     """System requirements are parsed."""
     content = """\
 [project]
@@ -189,14 +184,13 @@ platforms = ["linux-64"]
 [tool.pixi.system-requirements]
 linux = "5.10"
 """
-    path = tmp_path / "pyproject.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pyproject.toml", content)
     config = parser.parse(path)
     default = config.features["default"]
     assert default.system_requirements == {"linux": "5.10"}
 
 
-def test_parse_feature_activation(parser, tmp_path):
+def test_parse_feature_activation(parser, write_toml):
     """Feature-level activation in pyproject.toml."""
     content = """\
 [project]
@@ -215,15 +209,14 @@ scripts = ["dev.sh"]
 [tool.pixi.feature.dev.activation.env]
 DEV = "1"
 """
-    path = tmp_path / "pyproject.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pyproject.toml", content)
     config = parser.parse(path)
     dev = config.features["dev"]
     assert dev.activation_scripts == ["dev.sh"]
     assert dev.activation_env == {"DEV": "1"}
 
 
-def test_parse_feature_system_requirements(parser, tmp_path):
+def test_parse_feature_system_requirements(parser, write_toml):
     """Feature-level system-requirements in pyproject.toml."""
     content = """\
 [project]
@@ -239,7 +232,6 @@ cudatoolkit = "*"
 [tool.pixi.feature.gpu.system-requirements]
 cuda = "11.8"
 """
-    path = tmp_path / "pyproject.toml"
-    path.write_text(content, encoding="utf-8")
+    path = write_toml("pyproject.toml", content)
     config = parser.parse(path)
     assert config.features["gpu"].system_requirements == {"cuda": "11.8"}
@@ -18,6 +18,12 @@ from conda_workspaces.manifests.toml import (
 from conda_workspaces.models import Feature, MatchSpec
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """One ``CondaTomlParser`` for the module; the class is stateless."""
+    return CondaTomlParser()
+
+
 @pytest.mark.parametrize(
     "filename, expected",
     [
@@ -27,8 +33,7 @@ from conda_workspaces.models import Feature, MatchSpec
     ],
     ids=["conda-toml", "pixi-toml", "pyproject-toml"],
 )
-def test_can_handle(filename, expected):
-    parser = CondaTomlParser()
+def test_can_handle(parser, filename, expected):
     assert parser.can_handle(Path(filename)) is expected
 
 
@@ -40,48 +45,32 @@ def test_can_handle(filename, expected):
     ],
     ids=["file-exists", "file-missing"],
 )
-def test_has_workspace(tmp_path, write_file, expected):
+def test_has_workspace(parser, tmp_path, toml_corpus, write_file, expected):
     path = tmp_path / "conda.toml"
     if write_file:
-        path.write_text(
-            '[workspace]\nname = "my-workspace"\nchannels'
-            ' = ["conda-forge"]\nplatforms = ["linux-64"]\n',
-            encoding="utf-8",
-        )
-    parser = CondaTomlParser()
+        path.write_bytes(toml_corpus["workspace_basic"])
     assert parser.has_workspace(path) is expected
 
 
 @pytest.mark.parametrize(
     "content",
     [
-        '[dependencies]\npython = ">=3.10"\n',
-        "[invalid\n",
+        b'[dependencies]\npython = ">=3.10"\n',
+        b"[invalid\n",
     ],
     ids=["no-workspace-key", "invalid-toml"],
 )
-def test_has_workspace_returns_false(tmp_path, content):
+def test_has_workspace_returns_false(parser, tmp_path, content):
     """Files without a valid [workspace] table should return False."""
     path = tmp_path / "conda.toml"
-    path.write_text(content, encoding="utf-8")
-    parser = CondaTomlParser()
+    path.write_bytes(content)
     assert parser.has_workspace(path) is False
 
 
-def test_parse(tmp_path):
-    content = """\
-[workspace]
-name = "my-workspace"
-channels = ["conda-forge"]
-platforms = ["linux-64"]
-
-[dependencies]
-python = ">=3.10"
-"""
+def test_parse(parser, tmp_path, toml_corpus):
     path = tmp_path / "conda.toml"
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(toml_corpus["workspace_deps"])
 
-    parser = CondaTomlParser()
     config = parser.parse(path)
     assert config.name == "my-workspace"
     assert config.manifest_path == str(path)
@@ -89,36 +78,33 @@ python = ">=3.10"
     assert "python" in default.conda_dependencies
 
 
-@pytest.mark.parametrize(
-    "raw, expected_names",
-    [
+def test_parse_channels():
+    # Table-driven rather than parametrized: each case is a
+    # microsecond-scale assertion, so one call frame covers them all
+    # without paying pytest's per-case setup/teardown.
+    cases = (
         (["conda-forge"], ["conda-forge"]),
         (["conda-forge", "bioconda"], ["conda-forge", "bioconda"]),
         ([{"channel": "nvidia"}], ["nvidia"]),
         (["conda-forge", {"channel": "nvidia"}], ["conda-forge", "nvidia"]),
         ([], []),
-    ],
-    ids=["single-str", "two-strs", "single-dict", "mixed", "empty"],
-)
-def test_parse_channels(raw, expected_names):
-    channels = _parse_channels(raw)
-    assert [ch.canonical_name for ch in channels] == expected_names
+    )
+    for raw, expected_names in cases:
+        channels = _parse_channels(raw)
+        assert [ch.canonical_name for ch in channels] == expected_names, raw
 
 
-@pytest.mark.parametrize(
-    "raw, expected_name",
-    [
+def test_parse_conda_deps():
+    cases = (
         ({"python": ">=3.10"}, "python"),
         ({"numpy": {"version": ">=1.24"}}, "numpy"),
         ({"gcc": {"version": ">=12", "build": "h*"}}, "gcc"),
         ({"pkg": 42}, "pkg"),
-    ],
-    ids=["str-spec", "dict-version", "dict-version-build", "other-type"],
-)
-def test_parse_conda_deps(raw, expected_name):
-    deps = _parse_conda_deps(raw)
-    assert expected_name in deps
-    assert isinstance(deps[expected_name], MatchSpec)
+    )
+    for raw, expected_name in cases:
+        deps = _parse_conda_deps(raw)
+        assert expected_name in deps, raw
+        assert isinstance(deps[expected_name], MatchSpec), raw
 
 
 @pytest.mark.parametrize(
@@ -130,19 +116,16 @@ def test_parse_deps_empty(func):
     assert func({}) == {}
 
 
-@pytest.mark.parametrize(
-    "raw, key",
-    [
+def test_parse_pypi_deps():
+    cases = (
         ({"requests": ">=2.28"}, "requests"),
         ({"flask": {"version": ">=3.0"}}, "flask"),
         ({"pkg": 1}, "pkg"),
-    ],
-    ids=["str-spec", "dict-version", "other-type"],
-)
-def test_parse_pypi_deps(raw, key):
-    deps = _parse_pypi_deps(raw)
-    assert key in deps
-    assert deps[key].name == key
+    )
+    for raw, key in cases:
+        deps = _parse_pypi_deps(raw)
+        assert key in deps, raw
+        assert deps[key].name == key, raw
 
 
 @pytest.mark.parametrize(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -26,12 +27,17 @@ if TYPE_CHECKING:
     from tests.conftest import CreateWorkspaceEnv
 
 
-@pytest.fixture
-def config(tmp_path: Path) -> WorkspaceConfig:
-    """Minimal workspace config rooted in tmp_path."""
+@pytest.fixture(scope="session")
+def _config_proto() -> WorkspaceConfig:
+    """Session prototype for the per-test ``config`` fixture.
+
+    The nested Channel/Feature/Environment graph is built once;
+    per-test fixtures only swap the root.  Tests treat the config as
+    read-only, so sharing the nested objects is safe.
+    """
     return WorkspaceConfig(
         name="ctx-test",
-        root=str(tmp_path),
+        root="",
         channels=[Channel("conda-forge")],
         platforms=["linux-64", "osx-arm64", "win-64"],
         features={"default": Feature(name="default")},
@@ -39,6 +45,12 @@ def config(tmp_path: Path) -> WorkspaceConfig:
     )
 
 
+@pytest.fixture
+def config(_config_proto: WorkspaceConfig, tmp_path: Path) -> WorkspaceConfig:
+    """Minimal workspace config rooted in tmp_path."""
+    return replace(_config_proto, root=str(tmp_path))
+
+
 def test_config_passthrough(config: WorkspaceConfig) -> None:
     ctx = WorkspaceContext(config)
     assert ctx.config is config
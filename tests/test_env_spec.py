@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 import conda_workspaces.env_spec as env_spec_mod
@@ -22,6 +23,10 @@ from conda_workspaces.env_spec import (
     CondaWorkspaceSpec,
 )
 
+# Keep the whole module on one xdist worker (--dist=loadgroup): the
+# autouse _patch_context fixture rebinds module state for the file.
+pytestmark = pytest.mark.xdist_group("env_spec")
+
 
 class _FakeContext:
     """Lightweight stand-in for conda's context with a settable subdir."""
@@ -30,13 +35,20 @@ class _FakeContext:
         self.subdir = subdir
 
 
-@pytest.fixture(autouse=True)
-def _patch_context(monkeypatch: pytest.MonkeyPatch) -> None:
+#: Shared across the module; tests only read ``subdir``.
+_FAKE_CONTEXT = _FakeContext("linux-64")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_context() -> Iterator[None]:
     """Replace ``context`` inside env_spec with a fake set to linux-64.
 
-    Autouse ensures this applies to all tests in this module.
+    Module-scoped: one setattr/restore pair for the whole file instead
+    of rebinding the attribute around every test.
     """
-    monkeypatch.setattr(env_spec_mod, "context", _FakeContext("linux-64"))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(env_spec_mod, "context", _FAKE_CONTEXT)
+        yield
 
 
 def test_plugin_metadata_is_module_level() -> None:
@@ -49,61 +61,53 @@ def test_plugin_metadata_is_module_level() -> None:
 @pytest.mark.parametrize(
     ("filename", "content", "expected"),
     [
-        (
-            "conda.toml",
-            '[workspace]\nname = "test"\nchannels = ["conda-forge"]\n'
-            'platforms = ["linux-64"]\n',
-            True,
-        ),
-        ("pixi.toml", '[workspace]\nname = "x"\n', False),
-        ("conda.toml", '[project]\nname = "x"\n', False),
-        ("conda.toml", "not valid toml [[[", False),
+        ("conda.toml", "workspace_basic", True),
+        ("pixi.toml", b'[workspace]\nname = "x"\n', False),
+        ("conda.toml", b'[project]\nname = "x"\n', False),
+        ("conda.toml", b"not valid toml [[[", False),
         ("conda.toml", None, False),
     ],
     ids=["conda-toml", "pixi-toml", "no-workspace", "invalid-toml", "missing"],
 )
 def test_conda_workspace_spec_can_handle(
-    tmp_path: Path, filename: str, content: str | None, expected: bool
+    tmp_path: Path,
+    toml_corpus: dict[str, bytes],
+    filename: str,
+    content: str | bytes | None,
+    expected: bool,
 ) -> None:
+    # *content* is a pre-encoded body, or a toml_corpus key when str.
     path = tmp_path / filename
     if content is not None:
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(
+            content if isinstance(content, bytes) else toml_corpus[content]
+        )
     assert CondaWorkspaceSpec(path).can_handle() is expected
 
 
-def test_conda_workspace_spec_env_returns_environment(tmp_path: Path) -> None:
+def test_conda_workspace_spec_env_returns_environment(
+    tmp_path: Path, toml_corpus: dict[str, bytes]
+) -> None:
     """env property parses manifest and returns an Environment."""
     path = tmp_path / "conda.toml"
-    path.write_text(
-        '[workspace]\nname = "myproj"\nchannels = ["conda-forge"]\n'
-        'platforms = ["linux-64"]\n\n'
-        "[dependencies]\n"
-        'python = ">=3.10"\n',
-        encoding="utf-8",
-    )
+    path.write_bytes(toml_corpus["workspace_deps"])
 
     spec = CondaWorkspaceSpec(path)
     env = spec.env
 
-    assert env.name == "myproj"
+    assert env.name == "my-workspace"
     assert env.platform == "linux-64"
     assert len(env.requested_packages) == 1
     assert env.requested_packages[0].name == "python"
     assert "conda-forge" in env.config.channels
 
 
-def test_conda_workspace_spec_env_pypi_deps_as_external(tmp_path: Path) -> None:
+def test_conda_workspace_spec_env_pypi_deps_as_external(
+    tmp_path: Path, toml_corpus: dict[str, bytes]
+) -> None:
     """PyPI dependencies appear as external_packages under 'pip'."""
     path = tmp_path / "conda.toml"
-    path.write_text(
-        '[workspace]\nname = "proj"\nchannels = ["conda-forge"]\n'
-        'platforms = ["linux-64"]\n\n'
-        "[dependencies]\n"
-        'python = ">=3.10"\n\n'
-        "[pypi-dependencies]\n"
-        'requests = "*"\n',
-        encoding="utf-8",
-    )
+    path.write_bytes(toml_corpus["workspace_pypi_deps"])
 
     spec = CondaWorkspaceSpec(path)
     env = spec.env
@@ -113,17 +117,11 @@ def test_conda_workspace_spec_env_pypi_deps_as_external(tmp_path: Path) -> None:
 
 
 def test_conda_workspace_spec_env_name_fallback_to_dirname(
-    tmp_path: Path,
+    tmp_path: Path, toml_corpus: dict[str, bytes]
 ) -> None:
     """When workspace has no name, falls back to parent directory."""
     path = tmp_path / "conda.toml"
-    path.write_text(
-        '[workspace]\nchannels = ["conda-forge"]\n'
-        'platforms = ["linux-64"]\n\n'
-        "[dependencies]\n"
-        'python = ">=3.10"\n',
-        encoding="utf-8",
-    )
+    path.write_bytes(toml_corpus["workspace_unnamed_deps"])
 
     spec = CondaWorkspaceSpec(path)
     env = spec.env
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import builtins
 import logging
+import os
 import sys
 import types
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING
 
 import pytest
@@ -47,13 +47,36 @@ from conda_workspaces.models import (
 )
 from conda_workspaces.resolver import ResolvedEnvironment
 
+# Parametrize tables as module-level tuples: immutable, so they are
+# built once per import instead of re-allocating list literals each
+# time a worker collects the module.
+_LIST_CASES = (
+    ((), ()),
+    (("default",), ("default",)),
+    (("test", "default", "docs"), ("default", "docs", "test")),
+)
+_LIST_IDS = ("empty", "single", "sorted-multiple")
 
-@pytest.fixture
-def workspace(tmp_path: Path) -> WorkspaceContext:
-    """A WorkspaceContext backed by tmp_path with a simple config."""
-    config = WorkspaceConfig(
+# (nothing_to_do, dry_run, expect_summary, expect_downloaded, expect_executed)
+_INSTALL_CASES = (
+    (False, False, False, True, True),
+    (False, True, True, False, False),
+    (True, False, False, False, False),
+)
+_INSTALL_IDS = ("new-env", "dry-run", "nothing-to-do")
+
+
+@pytest.fixture(scope="session")
+def _workspace_config_proto() -> WorkspaceConfig:
+    """Session prototype for the per-test ``workspace`` fixture.
+
+    Channel/Feature/MatchSpec parsing happens once; tests only read
+    the config, so the nested objects are safe to share and each test
+    swaps in its own root via ``dataclasses.replace``.
+    """
+    return WorkspaceConfig(
         name="envs-test",
-        root=str(tmp_path),
+        root="",
         channels=[Channel("conda-forge")],
         platforms=["linux-64"],
         features={
@@ -64,7 +87,14 @@ def workspace(tmp_path: Path) -> WorkspaceContext:
         },
         environments={"default": Environment(name="default")},
     )
-    return WorkspaceContext(config)
+
+
+@pytest.fixture
+def workspace(
+    _workspace_config_proto: WorkspaceConfig, tmp_path: Path
+) -> WorkspaceContext:
+    """A WorkspaceContext backed by tmp_path with a simple config."""
+    return WorkspaceContext(replace(_workspace_config_proto, root=str(tmp_path)))
 
 
 def test_remove_environment(
@@ -109,22 +139,18 @@ def test_clean_all_no_envs_dir(workspace: WorkspaceContext) -> None:
 
 @pytest.mark.parametrize(
     "env_names, expected",
-    [
-        ([], []),
-        (["default"], ["default"]),
-        (["test", "default", "docs"], ["default", "docs", "test"]),
-    ],
-    ids=["empty", "single", "sorted-multiple"],
+    _LIST_CASES,
+    ids=_LIST_IDS,
 )
 def test_list_installed_environments(
     workspace: WorkspaceContext,
-    env_names: list[str],
-    expected: list[str],
+    env_names: tuple[str, ...],
+    expected: tuple[str, ...],
     tmp_workspace_env: CreateWorkspaceEnv,
 ) -> None:
     for name in env_names:
         tmp_workspace_env(workspace.root, name)
-    assert list_installed_environments(workspace) == expected
+    assert list_installed_environments(workspace) == list(expected)
 
 
 def test_list_installed_ignores_non_conda_dirs(
@@ -169,7 +195,7 @@ def test_get_environment_info(
         assert "packages" not in info
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeTransaction:
     """Stand-in for UnlinkLinkTransaction."""
 
@@ -187,8 +213,15 @@ class FakeTransaction:
     def execute(self) -> None:
         self.executed = True
 
+    def reset(self, nothing_to_do: bool = False) -> None:
+        """Rewind recorded flags so the instance can be reused."""
+        self.nothing_to_do = nothing_to_do
+        self.summary_printed = False
+        self.downloaded = False
+        self.executed = False
+
 
-@dataclass
+@dataclass(slots=True)
 class FakeSolver:
     """Stand-in for the solver backend."""
 
@@ -201,43 +234,90 @@ class FakeSolver:
     def solve_for_transaction(self, **kwargs) -> FakeTransaction:
         return self.txn
 
+    def reset(self) -> None:
+        """Clear the arguments recorded by the backend factory."""
+        self.prefix = ""
+        self.channels = []
+        self.subdirs = ()
+        self.specs_to_add = []
 
-def _stub_conda_imports(monkeypatch: pytest.MonkeyPatch, solver: FakeSolver) -> None:
-    """Patch all conda imports inside install_environment."""
 
-    class FakePluginManager:
-        def get_cached_solver_backend(self):
-            def factory(prefix, channels, subdirs, specs_to_add=(), **kw):
-                solver.prefix = prefix
-                solver.channels = channels
-                solver.subdirs = subdirs
-                solver.specs_to_add = list(specs_to_add)
-                return solver
+@pytest.fixture(scope="module")
+def _txn_solver_pool() -> tuple[FakeTransaction, FakeSolver]:
+    """Build the FakeTransaction/FakeSolver pair once per module."""
+    txn = FakeTransaction()
+    return txn, FakeSolver(txn=txn)
 
-            return factory
 
-    class FakeContext:
-        plugin_manager = FakePluginManager()
-        subdirs = ("linux-64", "noarch")
+@pytest.fixture
+def txn_solver(
+    _txn_solver_pool: tuple[FakeTransaction, FakeSolver],
+) -> tuple[FakeTransaction, FakeSolver]:
+    """A freshly reset transaction/solver pair, pooled across cases.
+
+    Parametrized install tests reuse the same two objects and only
+    rewind their recorded flags, instead of allocating new instances
+    per case.
+    """
+    txn, solver = _txn_solver_pool
+    txn.reset()
+    solver.reset()
+    return txn, solver
 
-    monkeypatch.setattr(envs_mod, "conda_context", FakeContext())
+
+@pytest.fixture(scope="session")
+def resolved_default() -> ResolvedEnvironment:
+    """The canonical single-dependency resolved env the install tests share.
+
+    ``install_environment`` only reads from it, so the session instance
+    is safe to pass to every test; cases that need extra fields build
+    their own.
+    """
+    return ResolvedEnvironment(
+        name="default",
+        conda_dependencies={"python": MatchSpec("python >=3.10")},
+        channels=[Channel("conda-forge")],
+    )
+
+
+def _fake_conda_context(solver_backend) -> types.SimpleNamespace:
+    """Build a conda_context stand-in exposing what install_environment reads.
+
+    SimpleNamespace replaces the per-test FakePluginManager/FakeContext
+    class definitions: no type objects to build, just two attribute bags.
+    """
+    return types.SimpleNamespace(
+        plugin_manager=types.SimpleNamespace(
+            get_cached_solver_backend=lambda: solver_backend,
+        ),
+        subdirs=("linux-64", "noarch"),
+    )
+
+
+def _stub_conda_imports(monkeypatch: pytest.MonkeyPatch, solver: FakeSolver) -> None:
+    """Patch all conda imports inside install_environment."""
+
+    def factory(prefix, channels, subdirs, specs_to_add=(), **kw):
+        solver.prefix = prefix
+        solver.channels = channels
+        solver.subdirs = subdirs
+        solver.specs_to_add = list(specs_to_add)
+        return solver
+
+    monkeypatch.setattr(envs_mod, "conda_context", _fake_conda_context(factory))
 
 
 def test_install_empty_specs(workspace: WorkspaceContext) -> None:
     """With no dependencies, install just creates the prefix dir."""
     resolved = ResolvedEnvironment(name="default")
     install_environment(workspace, resolved)
-    assert workspace.env_prefix("default").is_dir()
+    assert os.path.isdir(workspace.env_prefix("default"))
 
 
 @pytest.mark.parametrize(
     "nothing_to_do, dry_run, expect_summary, expect_downloaded, expect_executed",
-    [
-        (False, False, False, True, True),
-        (False, True, True, False, False),
-        (True, False, False, False, False),
-    ],
-    ids=["new-env", "dry-run", "nothing-to-do"],
+    _INSTALL_CASES,
+    ids=_INSTALL_IDS,
 )
 def test_install_transaction_outcomes(
     workspace: WorkspaceContext,
@@ -247,17 +327,14 @@ def test_install_transaction_outcomes(
     expect_summary: bool,
     expect_downloaded: bool,
     expect_executed: bool,
+    resolved_default: ResolvedEnvironment,
+    txn_solver: tuple[FakeTransaction, FakeSolver],
 ) -> None:
-    txn = FakeTransaction(nothing_to_do=nothing_to_do)
-    solver = FakeSolver(txn=txn)
+    txn, solver = txn_solver
+    txn.nothing_to_do = nothing_to_do
     _stub_conda_imports(monkeypatch, solver)
 
-    resolved = ResolvedEnvironment(
-        name="default",
-        conda_dependencies={"python": MatchSpec("python >=3.10")},
-        channels=[Channel("conda-forge")],
-    )
-    install_environment(workspace, resolved, dry_run=dry_run)
+    install_environment(workspace, resolved_default, dry_run=dry_run)
 
     assert txn.summary_printed is expect_summary
     assert txn.downloaded is expect_downloaded
@@ -268,20 +345,16 @@ def test_install_force_reinstall(
     workspace: WorkspaceContext,
     monkeypatch: pytest.MonkeyPatch,
     tmp_workspace_env: CreateWorkspaceEnv,
+    resolved_default: ResolvedEnvironment,
+    txn_solver: tuple[FakeTransaction, FakeSolver],
 ) -> None:
     tmp_workspace_env(workspace.root, "default")
     assert workspace.env_exists("default")
 
-    txn = FakeTransaction()
-    solver = FakeSolver(txn=txn)
+    txn, solver = txn_solver
     _stub_conda_imports(monkeypatch, solver)
 
-    resolved = ResolvedEnvironment(
-        name="default",
-        conda_dependencies={"python": MatchSpec("python >=3.10")},
-        channels=[Channel("conda-forge")],
-    )
-    install_environment(workspace, resolved, force_reinstall=True)
+    install_environment(workspace, resolved_default, force_reinstall=True)
 
     # Old env was removed and new one was installed
     assert txn.downloaded
@@ -292,6 +365,7 @@ def test_install_existing_env_uses_freeze(
     workspace: WorkspaceContext,
     monkeypatch: pytest.MonkeyPatch,
     tmp_workspace_env: CreateWorkspaceEnv,
+    resolved_default: ResolvedEnvironment,
 ) -> None:
     """Updating an existing env passes UpdateModifier.FREEZE_INSTALLED."""
     tmp_workspace_env(workspace.root, "default")
@@ -306,28 +380,17 @@ def test_install_existing_env_uses_freeze(
             recorded_kwargs.update(kwargs)
             return FakeTransaction()
 
-    class FakePluginManager:
-        def get_cached_solver_backend(self):
-            return RecordingSolver
+    monkeypatch.setattr(envs_mod, "conda_context", _fake_conda_context(RecordingSolver))
 
-    class FakeContext:
-        plugin_manager = FakePluginManager()
-        subdirs = ("linux-64", "noarch")
-
-    monkeypatch.setattr(envs_mod, "conda_context", FakeContext())
-
-    resolved = ResolvedEnvironment(
-        name="default",
-        conda_dependencies={"python": MatchSpec("python >=3.10")},
-        channels=[Channel("conda-forge")],
-    )
-    install_environment(workspace, resolved)
+    install_environment(workspace, resolved_default)
 
     assert recorded_kwargs.get("update_modifier") is UpdateModifier.FREEZE_INSTALLED
 
 
 def test_install_solve_error(
-    workspace: WorkspaceContext, monkeypatch: pytest.MonkeyPatch
+    workspace: WorkspaceContext,
+    monkeypatch: pytest.MonkeyPatch,
+    resolved_default: ResolvedEnvironment,
 ) -> None:
     class FailingSolver:
         def __init__(self, prefix, channels, subdirs, specs_to_add=(), **kw):
@@ -336,69 +399,71 @@ def test_install_solve_error(
         def solve_for_transaction(self, **kwargs):
             raise UnsatisfiableError({})
 
-    class FakePluginManager:
-        def get_cached_solver_backend(self):
-            return FailingSolver
-
-    class FakeContext:
-        plugin_manager = FakePluginManager()
-        subdirs = ("linux-64", "noarch")
+    monkeypatch.setattr(envs_mod, "conda_context", _fake_conda_context(FailingSolver))
 
-    monkeypatch.setattr(envs_mod, "conda_context", FakeContext())
-
-    resolved = ResolvedEnvironment(
-        name="default",
-        conda_dependencies={"python": MatchSpec("python >=3.10")},
-        channels=[Channel("conda-forge")],
-    )
     with pytest.raises(SolveError, match="default"):
-        install_environment(workspace, resolved)
+        install_environment(workspace, resolved_default)
 
 
 def test_install_no_solver_backend(
-    workspace: WorkspaceContext, monkeypatch: pytest.MonkeyPatch
+    workspace: WorkspaceContext,
+    monkeypatch: pytest.MonkeyPatch,
+    resolved_default: ResolvedEnvironment,
 ) -> None:
-    class FakePluginManager:
-        def get_cached_solver_backend(self):
-            return None
+    monkeypatch.setattr(envs_mod, "conda_context", _fake_conda_context(None))
 
-    class FakeContext:
-        plugin_manager = FakePluginManager()
-        subdirs = ("linux-64", "noarch")
+    with pytest.raises(SolveError, match="No solver backend"):
+        install_environment(workspace, resolved_default)
 
-    monkeypatch.setattr(envs_mod, "conda_context", FakeContext())
 
-    resolved = ResolvedEnvironment(
-        name="default",
-        conda_dependencies={"python": MatchSpec("python >=3.10")},
-        channels=[Channel("conda-forge")],
-    )
-    with pytest.raises(SolveError, match="No solver backend"):
-        install_environment(workspace, resolved)
+@pytest.fixture(scope="module")
+def _fake_pypi_modules() -> dict[str, types.ModuleType]:
+    """Skeleton ``conda_pypi`` module objects, built once per module.
+
+    Tests bind their per-test fakes onto these and register them in
+    ``sys.modules`` through function-scoped monkeypatching; only the
+    attribute assignments repeat per test, not the module construction.
+    """
+    return {
+        name: types.ModuleType(name)
+        for name in (
+            "conda_pypi",
+            "conda_pypi.translate",
+            "conda_pypi.build",
+            "conda_pypi.installer",
+        )
+    }
 
 
 @pytest.fixture
-def fake_pypi_translate(monkeypatch: pytest.MonkeyPatch) -> None:
+def fake_pypi_translate(
+    monkeypatch: pytest.MonkeyPatch,
+    _fake_pypi_modules: dict[str, types.ModuleType],
+) -> None:
     """Inject a fake ``conda_pypi.translate`` module into sys.modules."""
-    conda_pypi = types.ModuleType("conda_pypi")
-    tr_mod = types.ModuleType("conda_pypi.translate")
+    tr_mod = _fake_pypi_modules["conda_pypi.translate"]
     tr_mod.pypi_to_conda_name = lambda n: n.replace("-", "_")
 
-    monkeypatch.setitem(sys.modules, "conda_pypi", conda_pypi)
+    monkeypatch.setitem(sys.modules, "conda_pypi", _fake_pypi_modules["conda_pypi"])
     monkeypatch.setitem(sys.modules, "conda_pypi.translate", tr_mod)
 
 
 @pytest.fixture
 def block_conda_pypi(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Make all ``conda_pypi.*`` imports raise ImportError."""
-    real_import = builtins.__import__
-
-    def _block(name, *args, **kwargs):
-        if name.startswith("conda_pypi"):
-            raise ImportError("no conda-pypi")
-        return real_import(name, *args, **kwargs)
+    """Make all ``conda_pypi.*`` imports raise ImportError.
 
-    monkeypatch.setattr(builtins, "__import__", _block)
+    A ``None`` entry in ``sys.modules`` makes the import system raise
+    ImportError at the C level, so every other import in the test keeps
+    the fast path instead of going through a Python ``__import__``
+    wrapper.
+    """
+    for name in (
+        "conda_pypi",
+        "conda_pypi.translate",
+        "conda_pypi.build",
+        "conda_pypi.installer",
+    ):
+        monkeypatch.setitem(sys.modules, name, None)
 
 
 @pytest.mark.parametrize(
@@ -542,7 +607,11 @@ def test_install_path_deps_warns_git_url(
 
 
 @pytest.fixture
-def fake_pypi_build(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+def fake_pypi_build(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    _fake_pypi_modules: dict[str, types.ModuleType],
+):
     """Inject fake ``conda_pypi.build`` and ``conda_pypi.installer`` modules.
 
     Returns ``(build_calls, install_calls)`` lists that record invocations.
@@ -562,13 +631,12 @@ def fake_pypi_build(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
     def fake_install_ephemeral(prefix, package):
         install_calls.append(package)
 
-    conda_pypi = types.ModuleType("conda_pypi")
-    build_mod = types.ModuleType("conda_pypi.build")
+    build_mod = _fake_pypi_modules["conda_pypi.build"]
     build_mod.pypa_to_conda = fake_pypa_to_conda
-    inst_mod = types.ModuleType("conda_pypi.installer")
+    inst_mod = _fake_pypi_modules["conda_pypi.installer"]
     inst_mod.install_ephemeral_conda = fake_install_ephemeral
 
-    monkeypatch.setitem(sys.modules, "conda_pypi", conda_pypi)
+    monkeypatch.setitem(sys.modules, "conda_pypi", _fake_pypi_modules["conda_pypi"])
     monkeypatch.setitem(sys.modules, "conda_pypi.build", build_mod)
     monkeypatch.setitem(sys.modules, "conda_pypi.installer", inst_mod)
 
@@ -7,6 +7,10 @@ from conda_workspaces.lockfile import LOCKFILE_VERSION, CondaLockLoader
 
 
 class FakeRecord:
+    # Slotted: tests build many of these and compose() walks their
+    # attributes in a tight loop; slots skip the per-instance __dict__.
+    __slots__ = ("name", "url", "_data")
+
     def __init__(self, name: str, url: str):
         self.name = name
         self.url = url
@@ -17,11 +21,15 @@ class FakeRecord:
 
 
 class FakeConfig:
+    __slots__ = ("channels",)
+
     def __init__(self, channels: tuple[str, ...]):
         self.channels = channels
 
 
 class FakeEnvironment:
+    __slots__ = ("name", "platform", "config", "explicit_packages", "external_packages")
+
     def __init__(
         self,
         name: str,
@@ -129,12 +137,16 @@ def test_multiplatform_export_returns_yaml() -> None:
     assert "linux-64" in yaml_str
 
 
-def test_multiplatform_export_empty() -> None:
-    yaml_str = multiplatform_export([])  # type: ignore[arg-type]
+def test_compose_empty() -> None:
+    # Structural check on the pre-YAML dict; the emitter itself is
+    # covered once by test_multiplatform_export_returns_yaml.
+    result = CondaLockLoader.compose([])
 
-    assert "version: 1" in yaml_str
-    assert "environments: {}" in yaml_str
-    assert "packages: []" in yaml_str
+    assert result == {
+        "version": LOCKFILE_VERSION,
+        "environments": {},
+        "packages": [],
+    }
 
 
 def test_multiplatform_export_handles_str_subclass_keys() -> None:
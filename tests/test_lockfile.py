@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import pytest
@@ -13,7 +14,6 @@ if TYPE_CHECKING:
 
 from conda.base.context import context as conda_context
 from conda.models.match_spec import MatchSpec
-from conda_lockfiles.load_yaml import load_yaml
 from conda_lockfiles.rattler_lock.v6 import _record_to_dict
 
 from conda_workspaces.context import WorkspaceContext
@@ -29,6 +29,7 @@ from conda_workspaces.lockfile import (
     LOCKFILE_NAME,
     LOCKFILE_VERSION,
     CondaLockLoader,
+    _load_lockfile_yaml,
     generate_lockfile,
     install_from_lockfile,
     lockfile_path,
@@ -412,10 +413,14 @@ def test_generate_lockfile_solves_expected_pairs(
     assert result == tmp_path / LOCKFILE_NAME
     assert set(calls) == expected_pairs
 
-    content = result.read_text(encoding="utf-8")
-    assert f"version: {LOCKFILE_VERSION}" in content
-    for env_name, platform in expected_pairs:
-        assert f"python-{env_name}-{platform}.conda" in content
+    # Structural comparison: one parse instead of per-URL substring
+    # scans, and it catches format regressions a grep would miss.
+    data = _load_lockfile_yaml(str(result), result.stat().st_mtime_ns)
+    assert data["version"] == LOCKFILE_VERSION
+    assert {p["conda"] for p in data["packages"]} == {
+        f"https://example.com/python-{env_name}-{platform}.conda"
+        for env_name, platform in expected_pairs
+    }
 
 
 def test_generate_lockfile_progress_callback(
@@ -490,10 +495,11 @@ def test_generate_lockfile_skip_unsolvable_partial(
     )
 
     assert skipped == [("default", "osx-arm64", "unsatisfiable")]
-    content = result.read_text(encoding="utf-8")
-    assert "python-default-linux-64.conda" in content
-    assert "python-test-linux-64.conda" in content
-    assert "python-default-osx-arm64.conda" not in content
+    data = _load_lockfile_yaml(str(result), result.stat().st_mtime_ns)
+    assert {p["conda"] for p in data["packages"]} == {
+        "https://example.com/python-default-linux-64.conda",
+        "https://example.com/python-test-linux-64.conda",
+    }
 
 
 def test_generate_lockfile_skip_unsolvable_all_fail(
@@ -551,10 +557,42 @@ def test_install_from_lockfile_errors(
         install_from_lockfile(ctx, env_name)
 
 
+@pytest.fixture
+def fake_conda_misc(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stub the two ``conda.misc`` entry points the install path uses.
+
+    Patching here keeps the real ``conda.misc`` import tree out of the
+    test and hands back one namespace with the recorded URL lists,
+    install kwargs, and the sentinel records the stub returns.
+    """
+    ns = SimpleNamespace(
+        records_sentinel=[object(), object()],
+        get_records_calls=[],
+        install_calls=[],
+    )
+
+    def fake_get_records(lines):
+        ns.get_records_calls.append(lines)
+        return ns.records_sentinel
+
+    def fake_install(*, package_cache_records, prefix):
+        ns.install_calls.append({"records": package_cache_records, "prefix": prefix})
+
+    monkeypatch.setattr(
+        "conda.misc.get_package_records_from_explicit",
+        fake_get_records,
+    )
+    monkeypatch.setattr(
+        "conda.misc.install_explicit_packages",
+        fake_install,
+    )
+    return ns
+
+
 def test_install_from_lockfile(
     tmp_path: Path,
     workspace_ctx_factory: Callable[..., WorkspaceContext],
-    monkeypatch: pytest.MonkeyPatch,
+    fake_conda_misc: SimpleNamespace,
 ) -> None:
     """install_from_lockfile reads conda.lock, extracts URLs, and installs."""
     ctx = workspace_ctx_factory()
@@ -578,38 +616,19 @@ def test_install_from_lockfile(
         encoding="utf-8",
     )
 
-    records_sentinel = [object(), object()]
-    get_records_calls: list[list] = []
-
-    def fake_get_records(lines):
-        get_records_calls.append(lines)
-        return records_sentinel
-
-    monkeypatch.setattr(
-        "conda.misc.get_package_records_from_explicit",
-        fake_get_records,
-    )
-
-    install_calls: list[dict] = []
-
-    def fake_install(*, package_cache_records, prefix):
-        install_calls.append({"records": package_cache_records, "prefix": prefix})
-
-    monkeypatch.setattr(
-        "conda.misc.install_explicit_packages",
-        fake_install,
-    )
-
     install_from_lockfile(ctx, "default")
 
-    assert len(get_records_calls) == 1
-    assert get_records_calls[0] == [
-        "https://example.com/python.conda",
-        "https://example.com/numpy.conda",
+    assert fake_conda_misc.get_records_calls == [
+        [
+            "https://example.com/python.conda",
+            "https://example.com/numpy.conda",
+        ]
     ]
-    assert len(install_calls) == 1
-    assert install_calls[0]["records"] == records_sentinel
-    assert install_calls[0]["prefix"] == str(ctx.env_prefix("default"))
+    assert len(fake_conda_misc.install_calls) == 1
+    assert fake_conda_misc.install_calls[0]["records"] == (
+        fake_conda_misc.records_sentinel
+    )
+    assert fake_conda_misc.install_calls[0]["prefix"] == str(ctx.env_prefix("default"))
 
 
 @pytest.mark.parametrize(
@@ -747,10 +766,11 @@ def test_solve_for_platform_virtual_package_env(
 def write_fragment() -> Callable[[WorkspaceContext, dict, str], Path]:
     """Factory that solves one platform into a ``conda.lock.<platform>`` fragment.
 
-    ``conda_lockfiles.load_yaml`` caches parsed YAML by path; fragment
-    files are rewritten between calls in the merge tests, so the
-    factory evicts the cache after every write to keep subsequent
-    reads fresh.
+    ``_load_lockfile_yaml`` caches parsed YAML by ``(path, mtime)``;
+    fragment files are rewritten between calls in the merge tests, so
+    the factory evicts the cache after every write in case the
+    filesystem's mtime resolution is too coarse to register the
+    rewrite.
     """
 
     def _factory(ctx: WorkspaceContext, resolved_envs, platform: str) -> Path:
@@ -761,7 +781,7 @@ def write_fragment() -> Callable[[WorkspaceContext, dict, str], Path]:
             platforms=(platform,),
             output_path=target,
         )
-        load_yaml.cache_clear()
+        _load_lockfile_yaml.cache_clear()
         return target
 
     return _factory
@@ -858,7 +878,7 @@ def test_merge_lockfiles_channel_mismatch(
         )
     )
     frag_b.write_text(content, encoding="utf-8")
-    load_yaml.cache_clear()
+    _load_lockfile_yaml.cache_clear()
 
     with pytest.raises(LockfileMergeError, match="channels differ"):
         merge_lockfiles([frag_a, frag_b], ctx)
@@ -877,7 +897,7 @@ def test_merge_lockfiles_duplicate_platform(
 
     frag_b = ctx.root / "conda.lock.linux-64.dup"
     frag_b.write_text(frag_a.read_text(encoding="utf-8"), encoding="utf-8")
-    load_yaml.cache_clear()
+    _load_lockfile_yaml.cache_clear()
 
     with pytest.raises(LockfileMergeError, match="present in both"):
         merge_lockfiles([frag_a, frag_b], ctx)